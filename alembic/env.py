@@ -8,18 +8,21 @@ Key Features:
 - Async migration support for asyncpg
 - Auto-detection of model changes
 - Environment variable configuration support
+- PostgreSQL advisory lock so concurrent replicas never migrate at once
+- MIGRATION_MODE=skip to turn Alembic runs into a no-op
 """
 
 import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import pool
+from sqlalchemy import pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
 # Import your models here so Alembic can detect them
+from app.config import get_settings
 from app.database import Base
 from app.models.payment import Payment  # noqa: F401
 
@@ -69,11 +72,18 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
+# Key for the session-level advisory lock serializing migration runs
+MIGRATION_LOCK_KEY = "alembic_migration"
+
+
 async def run_async_migrations() -> None:
     """
     Run migrations asynchronously.
 
-    Creates an async engine, connects, and runs migrations.
+    Creates an async engine, connects, and runs migrations. All steps share
+    a single connection that holds a PostgreSQL advisory lock for the whole
+    run, so multiple replicas starting at once migrate one after another
+    instead of racing each other.
     """
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
@@ -82,7 +92,19 @@ async def run_async_migrations() -> None:
     )
 
     async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
+        # Session-level lock: commit right away so Alembic starts from a clean
+        # transaction state while the lock stays held on this connection
+        await connection.execute(
+            text("SELECT pg_advisory_lock(hashtext(:key))"), {"key": MIGRATION_LOCK_KEY}
+        )
+        await connection.commit()
+        try:
+            await connection.run_sync(do_run_migrations)
+        finally:
+            await connection.execute(
+                text("SELECT pg_advisory_unlock(hashtext(:key))"), {"key": MIGRATION_LOCK_KEY}
+            )
+            await connection.commit()
 
     await connectable.dispose()
 
@@ -97,7 +119,12 @@ def run_migrations_online() -> None:
 
 
 # Determine migration mode and run
-if context.is_offline_mode():
+# MIGRATION_MODE=skip lets container entrypoints invoke Alembic unconditionally
+# while a dedicated job owns schema migrations. Read through the app settings,
+# which also load .env, so Alembic and the app always agree on the mode
+if get_settings().MIGRATION_MODE == "skip":
+    pass
+elif context.is_offline_mode():
     run_migrations_offline()
 else:
     run_migrations_online()
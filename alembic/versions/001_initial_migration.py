@@ -45,8 +45,7 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id')
     )
 
-    # Create indexes for efficient querying
-    op.create_index('ix_payment_id', 'payments', ['id'], unique=False)
+    # Create indexes for efficient querying (the primary key is already indexed)
     op.create_index('ix_payment_customer_id', 'payments', ['customer_id'], unique=False)
     op.create_index('ix_payment_datetime', 'payments', ['datetime'], unique=False)
 
@@ -55,7 +54,6 @@ def downgrade() -> None:
     # Drop indexes
     op.drop_index('ix_payment_datetime', table_name='payments')
     op.drop_index('ix_payment_customer_id', table_name='payments')
-    op.drop_index('ix_payment_id', table_name='payments')
 
     # Drop payments table
     op.drop_table('payments')
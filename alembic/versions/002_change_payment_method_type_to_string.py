@@ -9,10 +9,16 @@ Benefits:
 - No migration needed when adding new payment methods
 - Validation happens at application level (already implemented)
 - Simpler database management
+
+The data copy runs in committed batches so that large tables are never
+locked by a single long-running UPDATE. That makes the upgrade non-atomic,
+so it is written to be rerun: if it fails partway, the already committed
+payment_method_new column is kept and the backfill resumes from the rows
+still missing a value.
 """
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -22,10 +28,31 @@ down_revision: Union[str, None] = '001'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows copied per committed batch when backfilling payment_method_new
+BATCH_SIZE = 10_000
+
+COPY_BATCH_SQL = """
+    UPDATE payments SET payment_method_new = payment_method::text
+    WHERE id IN (
+        SELECT id FROM payments WHERE payment_method_new IS NULL LIMIT :batch_size
+    )
+"""
+
 
 def upgrade() -> None:
-    op.add_column('payments', sa.Column('payment_method_new', sa.String(50), nullable=True))
-    op.execute("UPDATE payments SET payment_method_new = payment_method::text")
+    # IF NOT EXISTS: a rerun after a failed backfill finds the column committed
+    op.execute("ALTER TABLE payments ADD COLUMN IF NOT EXISTS payment_method_new VARCHAR(50)")
+    if context.is_offline_mode():
+        op.execute("UPDATE payments SET payment_method_new = payment_method::text")
+    else:
+        # Commit the new column, then backfill it in autocommitted batches so
+        # each UPDATE holds row locks on at most BATCH_SIZE rows
+        with op.get_context().autocommit_block():
+            bind = op.get_bind()
+            while True:
+                result = bind.execute(sa.text(COPY_BATCH_SQL), {"batch_size": BATCH_SIZE})
+                if result.rowcount == 0:
+                    break
     op.drop_column('payments', 'payment_method')
     op.alter_column('payments', 'payment_method_new', new_column_name='payment_method', nullable=False)
     op.create_index('ix_payments_payment_method', 'payments', ['payment_method'], unique=False)
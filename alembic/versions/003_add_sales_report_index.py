@@ -0,0 +1,52 @@
+"""Add covering index for the sales report query
+
+Revision ID: 003
+Revises: 6cf783e6d0c1
+Create Date: 2026-10-15 00:00:00.000000
+
+The hourly sales report filters payments by datetime and sums final_price
+and points. A btree on datetime that INCLUDEs those two columns lets
+PostgreSQL answer the report with an index-only scan instead of fetching
+every matching heap row. It also serves every lookup the plain datetime
+index did, so that index is dropped.
+
+Indexes are built CONCURRENTLY so writes are not blocked on large tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '003'
+down_revision: Union[str, None] = '6cf783e6d0c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_payments_sales_report',
+            'payments',
+            ['datetime'],
+            unique=False,
+            postgresql_include=['final_price', 'points'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_payment_datetime', table_name='payments', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_payment_datetime',
+            'payments',
+            ['datetime'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_payments_sales_report', table_name='payments', postgresql_concurrently=True
+        )
@@ -0,0 +1,51 @@
+"""Replace the customer_id index with a (customer_id, datetime) index
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 00:00:00.000000
+
+Customer history lookups filter on customer_id and usually on a datetime
+range, returning payments in datetime order. A composite btree serves the
+equality and the range (and the ordering) in one index scan, and still
+serves plain customer_id lookups through its leading column, so the
+single-column index is dropped.
+
+Indexes are built CONCURRENTLY so writes are not blocked on large tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_payment_customer_datetime',
+            'payments',
+            ['customer_id', 'datetime'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_payment_customer_id', table_name='payments', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_payment_customer_id',
+            'payments',
+            ['customer_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_payment_customer_datetime', table_name='payments', postgresql_concurrently=True
+        )
@@ -0,0 +1,62 @@
+"""Store additional_item as JSONB with a GIN index
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 00:00:00.000000
+
+JSON columns keep the raw text and are re-parsed on every access. JSONB is
+parsed once on write and supports GIN indexes, so lookups such as "all COD
+payments via YAMATO" (additional_item @> '{"courier": "YAMATO"}') can use an
+index. jsonb_path_ops is used as it is smaller and faster than the default
+operator class for the @> containment operator, the only one needed here.
+
+The type change rewrites the table under an exclusive lock; the index is
+then built CONCURRENTLY so writes are not blocked while it builds.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'payments',
+        'additional_item',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='additional_item::jsonb',
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_payment_additional_gin',
+            'payments',
+            ['additional_item'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'additional_item': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_payment_additional_gin', table_name='payments', postgresql_concurrently=True
+        )
+    op.alter_column(
+        'payments',
+        'additional_item',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='additional_item::json',
+    )
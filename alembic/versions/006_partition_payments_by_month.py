@@ -0,0 +1,107 @@
+"""Partition payments by month on datetime
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+
+A regular table can't be converted to a partitioned one in place, so the
+data is copied into a new partitioned table that then replaces it:
+
+1. Create payments_partitioned with the same columns, PARTITION BY RANGE
+2. Create the default partition and one monthly partition (UTC) for every
+   month from the oldest payment through next month
+3. Copy all rows, move the id sequence over and drop the old table
+4. Rename, add the (id, datetime) primary key and recreate the indexes
+
+PostgreSQL requires the partition key in the primary key, hence
+(id, datetime); ids stay unique through the shared sequence.
+
+The copy holds an exclusive lock on payments for its whole duration, so run
+this migration in a maintenance window on large tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CREATE_MONTH_PARTITIONS_SQL = """
+DO $$
+DECLARE
+    month timestamp;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', coalesce(min(datetime), now()) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '1 month',
+            interval '1 month'
+        )
+        FROM payments
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF payments_partitioned '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'payments_' || to_char(month, 'YYYY_MM'),
+            month || '+00',
+            (month + interval '1 month') || '+00'
+        );
+    END LOOP;
+END
+$$
+"""
+
+
+def create_indexes() -> None:
+    op.create_index(
+        'ix_payments_sales_report',
+        'payments',
+        ['datetime'],
+        unique=False,
+        postgresql_include=['final_price', 'points'],
+    )
+    op.create_index(
+        'ix_payment_customer_datetime', 'payments', ['customer_id', 'datetime'], unique=False
+    )
+    op.create_index('ix_payments_payment_method', 'payments', ['payment_method'], unique=False)
+    op.create_index(
+        'ix_payment_additional_gin',
+        'payments',
+        ['additional_item'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'additional_item': 'jsonb_path_ops'},
+    )
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE TABLE payments_partitioned (LIKE payments INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (datetime)'
+    )
+    op.execute('CREATE TABLE payments_default PARTITION OF payments_partitioned DEFAULT')
+    op.execute(CREATE_MONTH_PARTITIONS_SQL)
+
+    op.execute('INSERT INTO payments_partitioned SELECT * FROM payments')
+    op.execute('ALTER SEQUENCE payments_id_seq OWNED BY payments_partitioned.id')
+    op.drop_table('payments')
+
+    op.rename_table('payments_partitioned', 'payments')
+    op.create_primary_key('payments_pkey', 'payments', ['id', 'datetime'])
+    create_indexes()
+
+
+def downgrade() -> None:
+    op.execute('CREATE TABLE payments_unpartitioned (LIKE payments INCLUDING DEFAULTS)')
+    op.execute('INSERT INTO payments_unpartitioned SELECT * FROM payments')
+    op.execute('ALTER SEQUENCE payments_id_seq OWNED BY payments_unpartitioned.id')
+    # Dropping the partitioned table drops all of its partitions
+    op.drop_table('payments')
+
+    op.rename_table('payments_unpartitioned', 'payments')
+    op.create_primary_key('payments_pkey', 'payments', ['id'])
+    create_indexes()
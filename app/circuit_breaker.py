@@ -0,0 +1,110 @@
+"""
+Circuit Breaker
+
+This module provides a small async circuit breaker used to guard database-backed
+service calls from the GraphQL resolvers.
+
+When the database is slow or unavailable, every request would otherwise wait
+for its query to time out, holding a pooled connection the whole time. After
+`threshold` consecutive failures the breaker opens and rejects calls
+immediately for `reset_s` seconds. It then lets a single trial call through
+(half-open) while still rejecting the rest: a success closes it, while a
+failure re-opens it.
+
+Cancellation (e.g. a client disconnecting mid-request) says nothing about the
+database's health, so it counts as neither a success nor a failure.
+
+Usage:
+    async with db_circuit_breaker:
+        result = await asyncio.wait_for(service.get_sales_report(...), timeout)
+"""
+
+import asyncio
+import time
+
+from app.config import get_settings
+from app.services.payment_service import PaymentServiceError
+
+settings = get_settings()
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a call is rejected because the circuit breaker is open.
+
+    Attributes:
+        retry_after: Seconds until the breaker allows calls again
+    """
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(f"Circuit breaker is open. Retry after {retry_after:.1f}s")
+
+
+class CircuitBreaker:
+    """
+    Async context manager that counts consecutive failures of guarded calls.
+
+    Exceptions listed in `ignored` (e.g. validation errors) mean the call
+    reached a healthy backend, so they count as successes. BaseExceptions
+    that aren't Exceptions, such as asyncio.CancelledError, leave the
+    counts unchanged.
+
+    Attributes:
+        threshold: Consecutive failures before the breaker opens
+        reset_s: Seconds the breaker stays open before allowing calls again
+        failures: Current count of consecutive failures
+        opened_at: Monotonic time the breaker opened, or None when closed
+    """
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        reset_s: float = 30.0,
+        ignored: tuple[type[BaseException], ...] = (),
+    ):
+        self.threshold = threshold
+        self.reset_s = reset_s
+        self.ignored = ignored
+        self.failures = 0
+        self.opened_at: float | None = None
+        # Task running the half-open trial call, if one is in flight
+        self._trial_task: asyncio.Task | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_s
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        if self.opened_at is not None:
+            elapsed = time.monotonic() - self.opened_at
+            if elapsed < self.reset_s:
+                raise CircuitOpenError(self.reset_s - elapsed)
+            # Half-open: only one trial call at a time
+            if self._trial_task is not None:
+                raise CircuitOpenError(0.0)
+            self._trial_task = asyncio.current_task()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self._trial_task is not None and self._trial_task is asyncio.current_task():
+            self._trial_task = None
+
+        if exc_type is None or issubclass(exc_type, self.ignored):
+            self.failures = 0
+            self.opened_at = None
+        elif issubclass(exc_type, Exception):
+            self.failures += 1
+            # Open on reaching the threshold, or re-open on a half-open failure
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+        return False
+
+
+# Shared breaker for all database-backed resolver calls
+db_circuit_breaker = CircuitBreaker(
+    threshold=settings.CIRCUIT_BREAKER_THRESHOLD,
+    reset_s=settings.CIRCUIT_BREAKER_RESET_S,
+    ignored=(PaymentServiceError,),
+)
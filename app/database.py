@@ -8,31 +8,69 @@ Architecture:
 - AsyncEngine: Manages connection pool to PostgreSQL
 - async_sessionmaker: Factory for creating database sessions
 - get_db: Dependency injection function for FastAPI routes
+- warmup_pool: Pre-opens pooled connections at startup
+- migration_status: Startup schema setup state, reported by /health
+- Slow query log: Statements slower than SLOW_QUERY_MS are logged as warnings
 
 Connection pooling is configured for handling concurrent requests efficiently.
 """
 
+import asyncio
+import logging
+import time
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 # Create async engine with connection pool settings optimized for concurrent requests
+# - poolclass: Asyncio-aware queue pool (never the blocking sync QueuePool)
 # - pool_size: Number of connections to maintain in the pool
 # - max_overflow: Additional connections allowed beyond pool_size
-# - pool_pre_ping: Verify connections are alive before using them
+# - pool_timeout: Fail fast instead of waiting forever for a free connection
+# - pool_recycle: Replace connections before server/proxy idle timeouts drop them
+# - pool_pre_ping: Off by default; it costs an extra round-trip per checkout,
+#   and pool_recycle already retires connections before they go stale
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
-    pool_size=10,  # Base number of connections
-    max_overflow=20,  # Allow up to 30 total connections under load
-    pool_pre_ping=True,  # Health check connections before use
+    echo=False,  # Only slow statements are logged, see below
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
 )
 
+
+# Slow query log
+# Logging every statement (echo=True) is costly even in development, so only
+# statements slower than SLOW_QUERY_MS are reported. Start times are kept as a
+# stack on the connection: a statement that raises never reaches
+# after_cursor_execute, and its stale entry must not be used for the next one.
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+    if elapsed_ms > settings.SLOW_QUERY_MS:
+        logger.warning("Slow query (%.1f ms): %s", elapsed_ms, statement)
+
+
 # Session factory for creating database sessions
 # - expire_on_commit=False: Keep objects accessible after commit
 # - class_=AsyncSession: Use async session class
@@ -44,7 +82,9 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base class for all ORM models (SQLAlchemy 2.0 style)."""
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -55,6 +95,11 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     route handlers and GraphQL resolvers. The session is automatically
     closed when the request completes.
 
+    Nothing is committed here, so read-only requests skip the COMMIT
+    round-trip. Handlers that write should wrap the writes in
+    `async with db.begin():`, which commits on success and rolls back on error;
+    uncommitted work is rolled back when the session closes.
+
     Yields:
         AsyncSession: Database session for the current request
 
@@ -67,7 +112,6 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -88,6 +132,63 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+class MigrationStatus:
+    """
+    Tracks the state of schema setup performed at application startup.
+
+    Attributes:
+        mode: Configured MIGRATION_MODE (sync, async or skip)
+        state: One of pending, running, complete, failed or skipped
+        error: Error message if schema setup failed
+    """
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.state = "pending"
+        self.error: str | None = None
+
+    def as_dict(self) -> dict:
+        """Serialize the status for the health endpoint."""
+        return {"mode": self.mode, "state": self.state, "error": self.error}
+
+
+migration_status = MigrationStatus(settings.MIGRATION_MODE)
+
+
+async def run_startup_migrations() -> None:
+    """
+    Run startup schema setup, recording progress in migration_status.
+
+    Raises:
+        Exception: Re-raises any error from schema setup after recording it
+    """
+    migration_status.state = "running"
+    try:
+        await init_db()
+    except Exception as e:
+        migration_status.state = "failed"
+        migration_status.error = str(e)
+        raise
+    migration_status.state = "complete"
+
+
+async def warmup_pool(size: int | None = None) -> None:
+    """
+    Pre-open pool connections so early requests don't pay connect latency.
+
+    SQLAlchemy pools open connections lazily, so the first requests after
+    startup each pay for TCP setup and authentication. Opening them
+    concurrently and closing them right away returns them to the pool ready
+    for use. Should be called once at application startup.
+
+    Args:
+        size: Number of connections to open (defaults to DB_POOL_SIZE)
+    """
+    size = size or settings.DB_POOL_SIZE
+    connections = await asyncio.gather(*(engine.connect() for _ in range(size)))
+    await asyncio.gather(*(connection.close() for connection in connections))
+
+
 async def close_db() -> None:
     """
     Close database connections.
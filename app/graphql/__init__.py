@@ -8,6 +8,7 @@ Structure:
 - types.py: GraphQL type definitions (inputs and outputs)
 - mutations.py: Payment processing mutation
 - queries.py: Sales report query
+- context.py: Typed per-request resolver context
 
 Note: The schema is created in app/main.py with the SQLAlchemy session extension.
 """
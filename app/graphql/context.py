@@ -0,0 +1,64 @@
+"""
+GraphQL Request Context
+
+This module defines the typed context object passed to every GraphQL resolver.
+
+Using a class instead of a plain dict gives resolvers attribute access
+(`info.context.db`) rather than string-keyed lookups, and documents in one
+place everything a resolver can rely on being present.
+"""
+
+import asyncio
+from functools import cached_property
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from strawberry.fastapi import BaseContext
+
+from app.services.payment_service import PaymentService
+
+
+class GraphQLContext(BaseContext):
+    """
+    Per-request GraphQL context.
+
+    Inherits request/response/background_tasks from Strawberry's BaseContext,
+    which the FastAPI router populates for each request.
+
+    The database session is opened on first access, so operations that never
+    touch the database (e.g. introspection) don't create one at all.
+
+    Attributes:
+        db: Database session of the request, created on first use
+        payment_service: PaymentService bound to db, shared by all resolvers
+            in the request
+        db_lock: Serializes resolvers that query db directly; query fields
+            resolve concurrently, and a session runs one statement at a time
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        super().__init__()
+        self._session_factory = session_factory
+        self._db: AsyncSession | None = None
+
+    @property
+    def db(self) -> AsyncSession:
+        """Open the request's database session on first use."""
+        if self._db is None:
+            self._db = self._session_factory()
+        return self._db
+
+    async def close(self) -> None:
+        """Close the database session, if one was opened."""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    @cached_property
+    def payment_service(self) -> PaymentService:
+        """Create the request's PaymentService on first use."""
+        return PaymentService(self.db)
+
+    @cached_property
+    def db_lock(self) -> asyncio.Lock:
+        """Create the request's session lock on first use."""
+        return asyncio.Lock()
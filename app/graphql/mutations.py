@@ -8,16 +8,26 @@ Mutations in GraphQL represent operations that modify data.
 In this case, processing a payment creates a new payment record.
 """
 
+import asyncio
+
 import strawberry
 from strawberry.types import Info
 
+from app.circuit_breaker import CircuitOpenError, db_circuit_breaker
+from app.config import get_settings
+from app.graphql.context import GraphQLContext
 from app.graphql.types import (
     ErrorResponse,
     PaymentInput,
     PaymentResponse,
     PaymentResult,
 )
-from app.services.payment_service import PaymentService, PaymentServiceError
+from app.services.payment_service import PaymentServiceError
+
+settings = get_settings()
+
+# Fields of AdditionalItemInput forwarded to the service layer
+_ADDITIONAL_FIELDS = ("last4", "courier", "bank", "account_number", "cheque_number")
 
 
 def convert_additional_item_to_dict(additional_item) -> dict | None:
@@ -35,19 +45,13 @@ def convert_additional_item_to_dict(additional_item) -> dict | None:
     if additional_item is None:
         return None
 
-    result = {}
-    if additional_item.last4 is not None:
-        result["last4"] = additional_item.last4
-    if additional_item.courier is not None:
-        result["courier"] = additional_item.courier
-    if additional_item.bank is not None:
-        result["bank"] = additional_item.bank
-    if additional_item.account_number is not None:
-        result["account_number"] = additional_item.account_number
-    if additional_item.cheque_number is not None:
-        result["cheque_number"] = additional_item.cheque_number
+    result = {
+        field: value
+        for field in _ADDITIONAL_FIELDS
+        if (value := getattr(additional_item, field)) is not None
+    }
 
-    return result if result else None
+    return result or None
 
 
 @strawberry.type
@@ -62,7 +66,7 @@ class Mutation:
     @strawberry.mutation(description="Process a payment transaction")
     async def create_payment(
         self,
-        info: Info,
+        info: Info[GraphQLContext, None],
         input: PaymentInput,
     ) -> PaymentResult:
         """
@@ -73,7 +77,7 @@ class Mutation:
         2. Verifies the price modifier is within the allowed range for the payment method
         3. Validates additional payment-specific data
         4. Calculates final price and loyalty points
-        5. Stores the transaction in the database
+        5. Stores the transaction in the database and commits it
 
         Args:
             info: Strawberry context containing the database session
@@ -104,21 +108,26 @@ class Mutation:
                 }
             }
         """
-        db = info.context["db"]
-
-        service = PaymentService(db)
+        db = info.context.db
+        service = info.context.payment_service
 
         try:
             additional_item_dict = convert_additional_item_to_dict(input.additional_item)
 
-            result = await service.process_payment(
-                customer_id=input.customer_id,
-                price=input.price,
-                price_modifier=input.price_modifier,
-                payment_method=input.payment_method.value,
-                transaction_datetime=input.datetime,
-                additional_item=additional_item_dict,
-            )
+            # The transaction commits when the block exits normally and rolls
+            # back on any exception, including timeouts
+            async with db_circuit_breaker, db.begin():
+                result = await asyncio.wait_for(
+                    service.process_payment(
+                        customer_id=input.customer_id,
+                        price=input.price,
+                        price_modifier=input.price_modifier,
+                        payment_method=input.payment_method,
+                        transaction_datetime=input.datetime,
+                        additional_item=additional_item_dict,
+                    ),
+                    timeout=settings.QUERY_TIMEOUT_S,
+                )
 
             return PaymentResponse(
                 final_price=result["final_price"],
@@ -131,6 +140,18 @@ class Mutation:
                 message=e.message,
                 field=e.field,
             )
+        except CircuitOpenError:
+            return ErrorResponse(
+                error="SERVICE_UNAVAILABLE",
+                message="Payment processing is temporarily unavailable. Please retry shortly",
+                field=None,
+            )
+        except TimeoutError:
+            return ErrorResponse(
+                error="TIMEOUT",
+                message="Timed out while processing the payment",
+                field=None,
+            )
         except Exception:
             return ErrorResponse(
                 error="INTERNAL_ERROR",
@@ -8,19 +8,40 @@ Queries in GraphQL represent read-only operations that fetch data
 without modifying the database state.
 """
 
+import asyncio
+from functools import cache
+
 import strawberry
 from strawberry.types import Info
 
+from app.circuit_breaker import CircuitOpenError, db_circuit_breaker
+from app.config import get_settings
+from app.graphql.context import GraphQLContext
 from app.graphql.types import (
+    PAYMENT_METHOD_BY_NAME,
     ErrorResponse,
-    HourlySales,
     SalesReportInput,
     SalesReportResponse,
     SalesReportResult,
 )
 from app.models.payment import PaymentMethod
 from app.payment_methods.factory import PaymentMethodFactory
-from app.services.payment_service import PaymentService, PaymentServiceError
+from app.services.payment_service import PaymentServiceError
+
+settings = get_settings()
+
+
+@cache
+def _supported_payment_methods() -> tuple[PaymentMethod, ...]:
+    """
+    Build the supported payment method list once.
+
+    The factory registry is fixed at import time, so the enum members only
+    need to be resolved on the first call.
+    """
+    return tuple(
+        PAYMENT_METHOD_BY_NAME[name] for name in PaymentMethodFactory.get_supported_methods()
+    )
 
 
 @strawberry.type
@@ -36,7 +57,7 @@ class Query:
     @strawberry.field(description="Get hourly sales report within a date range")
     async def sales_report(
         self,
-        info: Info,
+        info: Info[GraphQLContext, None],
         input: SalesReportInput,
     ) -> SalesReportResult:
         """
@@ -89,24 +110,20 @@ class Query:
                 ]
             }
         """
-        db = info.context["db"]
-
-        service = PaymentService(db)
+        service = info.context.payment_service
 
         try:
-            report_data = await service.get_sales_report(
-                start_datetime=input.start_datetime,
-                end_datetime=input.end_datetime,
-            )
-
-            hourly_sales = [
-                HourlySales(
-                    datetime=item["datetime"],
-                    sales=item["sales"],
-                    points=item["points"],
+            # Rows already have the HourlySales shape, so they're returned as-is.
+            # Aliased reports in one document resolve concurrently on the same
+            # session, so they take turns
+            async with info.context.db_lock, db_circuit_breaker:
+                hourly_sales = await asyncio.wait_for(
+                    service.get_sales_report(
+                        start_datetime=input.start_datetime,
+                        end_datetime=input.end_datetime,
+                    ),
+                    timeout=settings.QUERY_TIMEOUT_S,
                 )
-                for item in report_data
-            ]
 
             return SalesReportResponse(sales=hourly_sales)
 
@@ -116,6 +133,18 @@ class Query:
                 message=e.message,
                 field=e.field,
             )
+        except CircuitOpenError:
+            return ErrorResponse(
+                error="SERVICE_UNAVAILABLE",
+                message="Sales reporting is temporarily unavailable. Please retry shortly",
+                field=None,
+            )
+        except TimeoutError:
+            return ErrorResponse(
+                error="TIMEOUT",
+                message="Timed out while generating the report",
+                field=None,
+            )
         except Exception:
             return ErrorResponse(
                 error="INTERNAL_ERROR",
@@ -134,5 +163,4 @@ class Query:
         Returns:
             List[PaymentMethod]: All available payment methods
         """
-        method_names = PaymentMethodFactory.get_supported_methods()
-        return [PaymentMethod(name) for name in method_names]
+        return list(_supported_payment_methods())
@@ -171,3 +171,7 @@ SalesReportResult = strawberry.union(
     types=[SalesReportResponse, ErrorResponse],
     description="Result of a sales report query - either data or error",
 )
+
+# Enum members by GraphQL name, for resolvers that hold plain method names
+# and would otherwise go through the Enum constructor on every lookup
+PAYMENT_METHOD_BY_NAME = {member.name: member for member in PaymentMethodEnum}
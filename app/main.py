@@ -7,24 +7,41 @@ This is the main application module that:
 3. Manages database connections and lifecycle events
 
 Application Features:
-- GraphQL endpoint at /graphql with GraphiQL playground
+- GraphQL endpoint at /graphql with GraphiQL playground (debug mode)
 - Health check endpoint at /health
 - Async database operations with PostgreSQL
 - Connection pooling for handling concurrent requests
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
+import orjson
 import strawberry
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from strawberry.extensions import SchemaExtension
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+from graphql.validation import NoSchemaIntrospectionCustomRule
+from strawberry.extensions import (
+    AddValidationRules,
+    ParserCache,
+    SchemaExtension,
+    ValidationCache,
+)
 from strawberry.fastapi import GraphQLRouter
 
 from app.config import get_settings
-from app.database import AsyncSessionLocal, close_db, init_db
+from app.database import (
+    AsyncSessionLocal,
+    close_db,
+    migration_status,
+    run_startup_migrations,
+    warmup_pool,
+)
+from app.graphql.context import GraphQLContext
 from app.graphql.mutations import Mutation
 from app.graphql.queries import Query
+from app.middleware import CombinedMiddleware
+from app.models.partitions import maintain_partitions
 
 settings = get_settings()
 
@@ -35,14 +52,37 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
 
     Handles startup and shutdown events:
-    - On startup: Initialize database tables
-    - On shutdown: Close database connections
+    - On startup: Initialize database tables, pre-warm the connection pool and
+      start the background task that pre-creates monthly payment partitions
+    - On shutdown: Stop background tasks and close database connections
+
+    Schema setup and pool warmup follow MIGRATION_MODE: "sync" waits for
+    them, "async" runs them in the background so the app starts serving
+    immediately, and "skip" leaves the schema to a separate migration job
+    and opens connections on demand.
 
     Using the modern lifespan context manager pattern instead of
     deprecated on_event decorators.
     """
-    await init_db()
+    migration_task = None
+    warmup_task = None
+    if settings.MIGRATION_MODE == "sync":
+        await run_startup_migrations()
+        await warmup_pool()
+    elif settings.MIGRATION_MODE == "async":
+        migration_task = asyncio.create_task(run_startup_migrations())
+        warmup_task = asyncio.create_task(warmup_pool())
+    else:
+        migration_status.state = "skipped"
+
+    partition_task = asyncio.create_task(maintain_partitions(wait_for=migration_task))
     yield
+
+    for task in (partition_task, migration_task, warmup_task):
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await task
     await close_db()
 
 
@@ -50,55 +90,77 @@ class SQLAlchemySessionExtension(SchemaExtension):
     """
     Strawberry extension for managing SQLAlchemy async session lifecycle.
 
-    This extension ensures that:
-    1. A database session is created for each request
-    2. The session is committed on success
-    3. The session is rolled back on error
-    4. The session is properly closed after the request
-    """
+    The context opens a database session lazily, the first time a resolver
+    asks for it; this extension ensures that session is closed after the
+    request. Requests that never touch the database, such as introspection,
+    skip session creation entirely.
 
-    async def on_request_start(self):
-        session = AsyncSessionLocal()
-        self.execution_context.context["db"] = session
+    Resolvers that write scope their transaction with `async with db.begin()`,
+    so read-only queries don't pay for a COMMIT round-trip. Closing the session rolls back any
+    uncommitted work.
+    """
 
     async def on_request_end(self):
-        db = self.execution_context.context.get("db")
-        if db:
-            try:
-                await db.commit()
-            except Exception:
-                await db.rollback()
-                raise
-            finally:
-                await db.close()
-
-
-async def get_context(request: Request) -> dict:
+        await self.execution_context.context.close()
+
+
+class ORJSONGraphQLRouter(GraphQLRouter):
+    """
+    GraphQL router that serializes responses with orjson.
+
+    Response bodies are plain dicts, lists, strings and numbers, which orjson
+    encodes several times faster than the standard json module. The bytes are
+    handed straight to the response, skipping a decode/encode round-trip.
+    """
+
+    def encode_json(self, response_data) -> bytes:
+        return orjson.dumps(response_data)
+
+
+async def get_context() -> GraphQLContext:
     """
     Create GraphQL context for each request.
 
     The context is passed to all resolvers and contains:
-    - request: The FastAPI request object
-    - db: Will be populated by SQLAlchemySessionExtension
+    - request: The FastAPI request object (set by the GraphQL router)
+    - db: Session opened from AsyncSessionLocal on first use and closed by
+      SQLAlchemySessionExtension
 
     This enables dependency injection pattern in GraphQL resolvers.
-    """
-    return {"request": request}
 
+    The getter takes no request parameter, so it doesn't make FastAPI build
+    anything extra; the request reference set by the router is the same
+    object FastAPI already holds for the lifetime of the request.
+    """
+    return GraphQLContext(session_factory=AsyncSessionLocal)
+
+
+# Schema extensions:
+# - ParserCache/ValidationCache: Repeated documents skip parse and validation,
+#   which dominate the cost of small queries and mutations
+# - NoSchemaIntrospection: Introspection is only allowed in debug mode
+# - SQLAlchemySessionExtension: Closes the per-request database session
+schema_extensions = [
+    ParserCache(maxsize=256),
+    ValidationCache(maxsize=256),
+    SQLAlchemySessionExtension,
+]
+if not settings.DEBUG:
+    schema_extensions.append(AddValidationRules([NoSchemaIntrospectionCustomRule]))
 
-# Create the GraphQL schema with session management extension
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
-    extensions=[SQLAlchemySessionExtension],
+    extensions=schema_extensions,
 )
 
 # Create GraphQL router with Strawberry
-# graphiql=True enables the interactive GraphQL playground
-graphql_router = GraphQLRouter(
+# graphiql enables the interactive GraphQL playground; it depends on
+# introspection, so it is only served in debug mode
+graphql_router = ORJSONGraphQLRouter(
     schema=schema,
     context_getter=get_context,
-    graphiql=True,  # Enable GraphiQL playground at /graphql
+    graphiql=settings.DEBUG,
 )
 
 app = FastAPI(
@@ -124,10 +186,13 @@ app = FastAPI(
     """,
     version="1.0.0",
     lifespan=lifespan,
+    # REST endpoints (/health, /) serialize with orjson, like GraphQL responses
+    default_response_class=ORJSONResponse,
 )
 
+# Single middleware layer for all cross-cutting concerns (CORS, timing)
 app.add_middleware(
-    CORSMiddleware,
+    CombinedMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
@@ -136,6 +201,20 @@ app.add_middleware(
 
 app.include_router(graphql_router, prefix="/graphql")
 
+if settings.DEBUG:
+    # Introspection result serialized once at startup for schema tooling
+    # (codegen, IDE plugins). Like GraphiQL, only exposed in debug mode.
+    # Built from a copy of the schema without extensions, since the async
+    # session extension can't run under Strawberry's sync execution.
+    _INTROSPECTION_JSON = orjson.dumps(
+        strawberry.Schema(query=Query, mutation=Mutation).introspect()
+    )
+
+    @app.get("/graphql/schema.json", tags=["GraphQL"], include_in_schema=False)
+    async def graphql_schema_json():
+        """Serve the precomputed GraphQL introspection result."""
+        return Response(_INTROSPECTION_JSON, media_type="application/json")
+
 
 @app.get("/health", tags=["Health"])
 async def health_check():
@@ -146,12 +225,13 @@ async def health_check():
     the application is running and responsive.
 
     Returns:
-        dict: Status and application information
+        dict: Status, application information and startup migration state
     """
     return {
         "status": "healthy",
         "app": settings.APP_NAME,
         "version": "1.0.0",
+        "migrations": migration_status.as_dict(),
     }
 
 
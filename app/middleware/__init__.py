@@ -0,0 +1,19 @@
+"""
+Middleware Package
+
+This package contains ASGI middleware applied to the FastAPI application.
+
+Middleware here is written against the raw ASGI interface (scope, receive,
+send) rather than Starlette's BaseHTTPMiddleware, so it adds no extra
+request/response objects or coroutines to the request path.
+
+Structure:
+- cors.py: CORS handling (PureASGICORS)
+- combined.py: The one middleware installed on the app, combining CORS with
+  response timing (CombinedMiddleware)
+"""
+
+from app.middleware.combined import CombinedMiddleware
+from app.middleware.cors import PureASGICORS
+
+__all__ = ["CombinedMiddleware", "PureASGICORS"]
@@ -0,0 +1,50 @@
+"""
+Combined Middleware
+
+This module provides the single ASGI middleware installed on the application.
+
+Every middleware layer adds a coroutine and a send wrapper to each request.
+Instead of stacking one layer per concern, CombinedMiddleware handles all of
+them in one `__call__` and one send wrapper:
+
+1. CORS: preflight short-circuit and response headers (from PureASGICORS)
+2. Timing: `x-response-time` header with the time until the response starts
+
+New cross-cutting concerns should be added here rather than as new layers.
+"""
+
+import time
+
+from starlette.types import Message, Receive, Scope, Send
+
+from app.middleware.cors import PureASGICORS
+
+
+class CombinedMiddleware(PureASGICORS):
+    """
+    ASGI middleware adding CORS and response timing headers.
+
+    Accepts the same arguments as PureASGICORS.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        cors_headers = await self.cors_headers(scope, send)
+        if cors_headers is None:
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    *cors_headers,
+                    (b"x-response-time", b"%.2fms" % elapsed_ms),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
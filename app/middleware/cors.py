@@ -0,0 +1,161 @@
+"""
+CORS Middleware
+
+This module provides a minimal pure ASGI CORS middleware.
+
+Everything that does not depend on the request (allowed methods, headers,
+credentials, exposed headers, max age) is built as header byte tuples once
+at startup. Per request the
+middleware only reads the Origin header, answers preflight requests
+directly without calling the application, and appends the CORS headers to
+the `http.response.start` message of every other response.
+
+Only the origin is checked. The allowed methods and headers are advertised
+in the preflight response and enforced by the browser.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+SAFELISTED_HEADERS = ("Accept", "Accept-Language", "Content-Language", "Content-Type")
+
+
+class PureASGICORS:
+    """
+    ASGI middleware adding CORS headers to HTTP responses.
+
+    Args:
+        app: The wrapped ASGI application
+        allow_origins: Origins allowed to make cross-origin requests ("*" for any)
+        allow_methods: Methods advertised to preflight requests ("*" for all)
+        allow_headers: Request headers advertised to preflight requests ("*" for any)
+        allow_credentials: Whether cookies and auth headers may be sent
+        expose_headers: Response headers readable by cross-origin scripts
+        max_age: Seconds browsers may cache a preflight response
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: tuple[str, ...] | list[str] = (),
+        allow_methods: tuple[str, ...] | list[str] = ("GET",),
+        allow_headers: tuple[str, ...] | list[str] = (),
+        allow_credentials: bool = False,
+        expose_headers: tuple[str, ...] | list[str] = (),
+        max_age: int = 600,
+    ):
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self.allow_all_headers = "*" in allow_headers
+
+        if "*" in allow_methods:
+            allow_methods = ALL_METHODS
+        headers = sorted(set(SAFELISTED_HEADERS) | set(allow_headers) - {"*"})
+
+        # Every header that doesn't depend on the request is joined and
+        # encoded here once, so responses only concatenate prebuilt tuples.
+        # Browsers reject a wildcard origin on credentialed requests, so the
+        # request's origin is echoed back (with Vary: Origin) unless any origin
+        # is allowed and credentials are off.
+        self.wildcard_origin_headers: tuple[tuple[bytes, bytes], ...] | None = None
+        if self.allow_all_origins and not allow_credentials:
+            self.wildcard_origin_headers = ((b"access-control-allow-origin", b"*"),)
+
+        credential_headers = ()
+        if allow_credentials:
+            credential_headers = ((b"access-control-allow-credentials", b"true"),)
+
+        self.simple_headers = credential_headers
+        if expose_headers:
+            self.simple_headers += (
+                (b"access-control-expose-headers", ", ".join(expose_headers).encode("latin-1")),
+            )
+
+        self.preflight_headers = (
+            *credential_headers,
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        )
+        self.allow_headers = ", ".join(headers).encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = await self.cors_headers(scope, send)
+        if cors_headers is None:
+            return
+        if not cors_headers:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def cors_headers(
+        self, scope: Scope, send: Send
+    ) -> tuple[tuple[bytes, bytes], ...] | None:
+        """
+        Work out the CORS headers for an HTTP request.
+
+        Preflight requests are answered here directly.
+
+        Args:
+            scope: ASGI scope of the request
+            send: ASGI send channel, used to answer preflight requests
+
+        Returns:
+            Headers to append to the response (empty for same-origin requests
+            and disallowed origins), or None if a preflight was answered
+        """
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Same-origin requests and disallowed origins get no CORS headers
+        if origin is None or not (self.allow_all_origins or origin in self.allow_origins):
+            return ()
+
+        origin_headers = self.wildcard_origin_headers or (
+            (b"access-control-allow-origin", origin),
+            (b"vary", b"Origin"),
+        )
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight_response(send, origin_headers, request_headers)
+            return None
+
+        return (*origin_headers, *self.simple_headers)
+
+    async def _preflight_response(
+        self,
+        send: Send,
+        origin_headers: tuple[tuple[bytes, bytes], ...],
+        request_headers: bytes | None,
+    ) -> None:
+        """Answer a preflight request without calling the application."""
+        if self.allow_all_headers and request_headers:
+            allow_headers = request_headers
+        else:
+            allow_headers = self.allow_headers
+
+        headers = [
+            *origin_headers,
+            *self.preflight_headers,
+            (b"access-control-allow-headers", allow_headers),
+        ]
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
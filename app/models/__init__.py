@@ -3,6 +3,8 @@ Database Models Package
 
 This package contains SQLAlchemy ORM models for the payment system.
 All models inherit from the Base class defined in database.py.
+
+partitions.py manages the monthly partitions of the payments table.
 """
 
 from app.models.payment import Payment, PaymentMethod
@@ -0,0 +1,94 @@
+"""
+Payment Table Partitions
+
+The payments table is range-partitioned by month on `datetime`, so sales
+reports only scan the partitions that overlap their time range instead of
+the whole table.
+
+Partitions are named payments_YYYY_MM and cover one calendar month in UTC.
+Rows outside every monthly partition land in payments_default (created with
+the table), so a missing partition never rejects a payment. A month's
+partition can't be created once the default partition holds rows for that
+month, which is why partitions are created ahead of time:
+maintain_partitions() runs in the background for the lifetime of the app and
+keeps the current and next month's partitions in place.
+"""
+
+import asyncio
+import logging
+from datetime import UTC, date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+# How often the background task re-checks upcoming partitions
+PARTITION_CHECK_INTERVAL_S = 24 * 60 * 60
+
+
+def add_months(month: date, months: int) -> date:
+    """Return the first day of the month `months` after `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Return the partition table name for a month (e.g. payments_2022_09)."""
+    return f"payments_{month:%Y_%m}"
+
+
+async def create_month_partition(conn: AsyncConnection, month: date) -> None:
+    """
+    Create the partition for a month if it doesn't exist yet.
+
+    Args:
+        conn: Connection to run the DDL on
+        month: Any date in the month; only year and month are used
+    """
+    start = month.replace(day=1)
+    end = add_months(start, 1)
+    await conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(start)} PARTITION OF payments "
+            f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') "
+            f"TO ('{end.isoformat()} 00:00:00+00')"
+        )
+    )
+
+
+async def ensure_partitions(months_ahead: int = 1) -> None:
+    """
+    Create the partitions for the current month and the next `months_ahead`.
+
+    Each month runs in its own transaction, so one failure (e.g. the default
+    partition already holds rows for that month) doesn't block the others.
+
+    Args:
+        months_ahead: Number of future months to prepare
+    """
+    current = datetime.now(UTC).date().replace(day=1)
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        try:
+            async with engine.begin() as conn:
+                await create_month_partition(conn, month)
+        except SQLAlchemyError:
+            logger.exception("Failed to create partition %s", partition_name(month))
+
+
+async def maintain_partitions(wait_for: asyncio.Task | None = None) -> None:
+    """
+    Keep upcoming partitions in place until cancelled.
+
+    Args:
+        wait_for: Schema setup task to wait for before the first check
+    """
+    if wait_for is not None:
+        await asyncio.wait([wait_for])
+    while True:
+        await ensure_partitions()
+        await asyncio.sleep(PARTITION_CHECK_INTERVAL_S)
@@ -7,22 +7,30 @@ information in a JSON field for flexibility.
 
 Model Design Decisions:
 1. PaymentMethod as Python Enum: Type safety in application code
-2. String column in DB: Avoids PostgreSQL enum migration complexity
+2. Non-native Enum column: Stored as plain VARCHAR (no PostgreSQL enum type
+   to ALTER, no CHECK constraint to migrate), loaded as PaymentMethod members
 3. Decimal for monetary values: Avoids floating-point precision issues
-4. JSON for additional_item: Flexible storage for payment method specific data
+4. JSONB for additional_item: Flexible storage for payment method specific data,
+   stored pre-parsed and GIN-indexed for containment lookups
 5. Indexed datetime: Enables efficient sales reporting queries by time range
+6. Monthly range partitions on datetime: Reports only scan the partitions
+   overlapping their time range (see models/partitions.py)
 """
 
 import enum
 
 from sqlalchemy import (
-    JSON,
+    DDL,
     Column,
     DateTime,
+    Enum,
+    Index,
     Integer,
     Numeric,
     String,
+    event,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -69,31 +77,54 @@ class Payment(Base):
     the original price, applied modifiers, calculated final price, and
     awarded points.
 
+    The table is partitioned by month on datetime. PostgreSQL requires the
+    partition key in every unique constraint, so the primary key is
+    (id, datetime); id alone stays unique through its sequence.
+
     Attributes:
-        id: Primary key, auto-incremented
+        id: Primary key (with datetime), auto-incremented
         customer_id: Identifier of the customer making the payment
         price: Original price before modifiers (Decimal for precision)
         price_modifier: Applied modifier (e.g., 0.95 for 5% discount)
         final_price: Calculated final price (price * price_modifier)
         points: Loyalty points awarded for this transaction
         payment_method: Type of payment used (from PaymentMethod enum)
-        additional_item: JSON field for payment-specific data:
+        additional_item: JSONB field for payment-specific data:
             - Card payments: {"last4": "1234"}
             - CASH_ON_DELIVERY: {"courier": "YAMATO"}
             - BANK_TRANSFER: {"bank": "...", "account_number": "..."}
             - CHEQUE: {"bank": "...", "cheque_number": "..."}
-        datetime: When the payment was made (for sales reporting)
+        datetime: When the payment was made (for sales reporting), partition key
         created_at: When the record was created (audit purposes)
 
     Indexes:
-        - ix_payment_datetime: For efficient time-range queries in sales reports
-        - ix_payment_customer_id: For customer payment history lookups
+        - ix_payments_sales_report: Time-range queries in sales reports; includes
+          final_price and points so the report runs as an index-only scan
+        - ix_payment_customer_datetime: Customer payment history, optionally
+          within a time range, returned in datetime order
+        - ix_payment_additional_gin: Containment lookups on additional_item,
+          e.g. additional_item @> '{"courier": "YAMATO"}'
     """
 
     __tablename__ = "payments"
-
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    customer_id = Column(String(255), nullable=False, index=True)
+    __table_args__ = (
+        Index(
+            "ix_payments_sales_report",
+            "datetime",
+            postgresql_include=["final_price", "points"],
+        ),
+        Index("ix_payment_customer_datetime", "customer_id", "datetime"),
+        Index(
+            "ix_payment_additional_gin",
+            "additional_item",
+            postgresql_using="gin",
+            postgresql_ops={"additional_item": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (datetime)"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    customer_id = Column(String(255), nullable=False)
 
     # precision=10, scale=2 allows values up to 99,999,999.99
     price = Column(Numeric(precision=10, scale=2), nullable=False)
@@ -101,14 +132,30 @@ class Payment(Base):
     final_price = Column(Numeric(precision=10, scale=2), nullable=False)
     points = Column(Integer, nullable=False, default=0)
 
-    payment_method = Column(String(50), nullable=False, index=True)
-    additional_item = Column(JSON, nullable=True)
+    # native_enum=False keeps the existing VARCHAR(50) column; SQLAlchemy
+    # converts to and from PaymentMethod and rejects unknown strings on write
+    payment_method = Column(
+        Enum(PaymentMethod, native_enum=False, length=50, validate_strings=True),
+        nullable=False,
+        index=True,
+    )
+    additional_item = Column(JSONB, nullable=True)
 
-    datetime = Column(DateTime(timezone=True), nullable=False, index=True)
+    datetime = Column(DateTime(timezone=True), primary_key=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     def __repr__(self) -> str:
         return (
             f"<Payment(id={self.id}, customer={self.customer_id}, "
-            f"method={self.payment_method}, final={self.final_price})>"
+            f"method={self.payment_method.value}, final={self.final_price})>"
         )
+
+
+# A partitioned table rejects rows no partition accepts. The default partition
+# catches rows outside the pre-created monthly partitions (e.g. backdated
+# payments), so inserts never fail on a missing month.
+event.listen(
+    Payment.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS payments_default PARTITION OF payments DEFAULT"),
+)
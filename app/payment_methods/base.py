@@ -15,9 +15,13 @@ By using this pattern, adding a new payment method only requires:
 2. Registering it in the PaymentMethodFactory
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC
 from decimal import Decimal
 
+# Basis points per unit. Modifier ranges and points rates are also kept as
+# integer basis points (e.g. 0.95 -> 9500) so pricing runs on exact int math
+BP = 10_000
+
 
 class PaymentMethodError(Exception):
     """
@@ -43,20 +47,65 @@ class BasePaymentMethod(ABC):
     - max_modifier: Maximum allowed price modifier (e.g., 1.02 for 2% surcharge)
     - points_rate: Rate for calculating loyalty points (e.g., 0.05 for 5%)
 
-    Methods to implement:
-    - validate_additional_item: Validate payment-specific additional data
+    Payment-specific additional data is declared rather than coded:
+    - required_additional_fields: (key, error message) pairs that must be
+      present and non-empty in additional_item, checked in order
+    - missing_additional_item_error: Message when additional_item is absent
+      altogether; defaults to the first required field's message
+    - clean_additional_value: Optional hook to normalize and check a value
+
+    Prices and modifiers arrive as Decimals and are split once into exact
+    integer ratios; range checks, the final price and points are then
+    computed with integer arithmetic and only the final price is converted
+    back to a Decimal for storage.
+
+    Handlers are stateless shared instances, so they declare empty __slots__
+    (subclasses too) and carry no per-instance __dict__.
     """
 
+    __slots__ = ()
+
     # Subclasses must define these class attributes
     min_modifier: Decimal
     max_modifier: Decimal
     points_rate: Decimal
 
-    @abstractmethod
+    # Payment-specific additional data; methods without any accept anything
+    required_additional_fields: tuple[tuple[str, str], ...] = ()
+    missing_additional_item_error: str | None = None
+
+    # Derived in __init_subclass__: integer basis-point copies of the above and
+    # the out-of-range error message with the bounds already filled in
+    _min_modifier_bp: int
+    _max_modifier_bp: int
+    _points_rate_bp: int
+    _modifier_error: str
+    # Whether process() has to call validate_additional_item at all
+    _requires_additional_item: bool
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._requires_additional_item = (
+            bool(cls.required_additional_fields)
+            or cls.validate_additional_item is not BasePaymentMethod.validate_additional_item
+        )
+        # Intermediate bases (e.g. CardPaymentBase) don't declare rates
+        if hasattr(cls, "points_rate"):
+            cls._min_modifier_bp = int(cls.min_modifier * BP)
+            cls._max_modifier_bp = int(cls.max_modifier * BP)
+            cls._points_rate_bp = int(cls.points_rate * BP)
+            cls._modifier_error = (
+                f"Price modifier must be between {cls.min_modifier} and "
+                f"{cls.max_modifier} for this payment method. Got: {{modifier}}"
+            )
+
     def validate_additional_item(self, additional_item: dict | None) -> dict:
         """
         Validate and process additional payment-specific data.
 
+        Checks required_additional_fields in a single pass and builds the
+        validated dict from their cleaned values, dropping any other keys.
+
         Args:
             additional_item: Dictionary with payment-specific fields
                 - Card payments: {"last4": "1234"}
@@ -70,7 +119,41 @@ class BasePaymentMethod(ABC):
         Raises:
             PaymentMethodError: If validation fails
         """
-        pass
+        required = self.required_additional_fields
+        if not required:
+            return additional_item or {}
+
+        if not additional_item:
+            if self.missing_additional_item_error is not None:
+                raise PaymentMethodError(self.missing_additional_item_error, field="additionalItem")
+            key, message = required[0]
+            raise PaymentMethodError(message, field=f"additionalItem.{key}")
+
+        validated = {}
+        for key, message in required:
+            value = additional_item.get(key)
+            if not value:
+                raise PaymentMethodError(message, field=f"additionalItem.{key}")
+            validated[key] = self.clean_additional_value(key, value)
+        return validated
+
+    def clean_additional_value(self, key: str, value: object) -> str:
+        """
+        Normalize a required additional_item value.
+
+        Override to add payment-specific checks on top of the presence check.
+
+        Args:
+            key: The additional_item key being validated
+            value: Its (non-empty) value
+
+        Returns:
+            str: The value to store
+
+        Raises:
+            PaymentMethodError: If the value is invalid
+        """
+        return str(value).strip()
 
     def validate_price_modifier(self, price_modifier: Decimal) -> None:
         """
@@ -87,27 +170,45 @@ class BasePaymentMethod(ABC):
         Raises:
             PaymentMethodError: If modifier is outside allowed range
         """
-        if price_modifier < self.min_modifier or price_modifier > self.max_modifier:
+        numerator, denominator = price_modifier.as_integer_ratio()
+        scaled = numerator * BP
+        if (
+            scaled < self._min_modifier_bp * denominator
+            or scaled > self._max_modifier_bp * denominator
+        ):
             raise PaymentMethodError(
-                f"Price modifier must be between {self.min_modifier} and "
-                f"{self.max_modifier} for this payment method. Got: {price_modifier}",
+                self._modifier_error.format(modifier=price_modifier),
                 field="priceModifier",
             )
 
-    def calculate_final_price(self, price: Decimal, price_modifier: Decimal) -> Decimal:
+    @staticmethod
+    def calculate_final_price(price: Decimal, price_modifier: Decimal) -> Decimal:
         """
         Calculate the final price after applying the modifier.
 
+        Works on exact integer ratios, whose size grows with the exponents of
+        the inputs, so callers must bound them first (PaymentService checks
+        prices against the NUMERIC(10, 2) column).
+
         Args:
             price: Original price before modification
             price_modifier: Multiplier to apply (e.g., 0.95 for 5% off)
 
         Returns:
-            Decimal: Final price rounded to 2 decimal places
+            Decimal: Final price rounded half-to-even to 2 decimal places
         """
-        return (price * price_modifier).quantize(Decimal("0.01"))
-
-    def calculate_points(self, price: Decimal) -> int:
+        price_num, price_den = price.as_integer_ratio()
+        modifier_num, modifier_den = price_modifier.as_integer_ratio()
+        denominator = price_den * modifier_den
+
+        cents, remainder = divmod(price_num * modifier_num * 100, denominator)
+        # Round half to even, as Decimal.quantize does under the default context
+        if remainder * 2 > denominator or (remainder * 2 == denominator and cents % 2):
+            cents += 1
+        return Decimal(cents).scaleb(-2)
+
+    @staticmethod
+    def calculate_points(price: Decimal, points_rate_bp: int) -> int:
         """
         Calculate loyalty points based on the original price.
 
@@ -116,11 +217,13 @@ class BasePaymentMethod(ABC):
 
         Args:
             price: Original price before modification
+            points_rate_bp: Points rate in basis points (e.g., 500 for 5%)
 
         Returns:
             int: Number of points to award (truncated, not rounded)
         """
-        return int(price * self.points_rate)
+        numerator, denominator = price.as_integer_ratio()
+        return numerator * points_rate_bp // (denominator * BP)
 
     def process(
         self, price: Decimal, price_modifier: Decimal, additional_item: dict | None
@@ -148,9 +251,13 @@ class BasePaymentMethod(ABC):
             PaymentMethodError: If any validation fails
         """
         self.validate_price_modifier(price_modifier)
-        validated_additional_item = self.validate_additional_item(additional_item)
+        # Methods without additional data requirements skip the validator call
+        if self._requires_additional_item:
+            validated_additional_item = self.validate_additional_item(additional_item)
+        else:
+            validated_additional_item = additional_item or {}
 
         final_price = self.calculate_final_price(price, price_modifier)
-        points = self.calculate_points(price)
+        points = self.calculate_points(price, self._points_rate_bp)
 
         return final_price, points, validated_additional_item
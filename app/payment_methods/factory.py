@@ -45,6 +45,13 @@ PAYMENT_METHODS: dict[PaymentMethod, type[BasePaymentMethod]] = {
     PaymentMethod.CHEQUE: ChequePayment,
 }
 
+# Handlers hold no per-payment state, so one shared instance per method is
+# built at import time instead of allocating a new handler for every payment
+_HANDLER_INSTANCES: dict[PaymentMethod, BasePaymentMethod] = {
+    method: handler_class() for method, handler_class in PAYMENT_METHODS.items()
+}
+_SUPPORTED_NAMES: tuple[str, ...] = tuple(method.value for method in PAYMENT_METHODS)
+
 
 class PaymentMethodFactory:
     """
@@ -65,7 +72,10 @@ class PaymentMethodFactory:
     @staticmethod
     def create(payment_method: PaymentMethod) -> BasePaymentMethod:
         """
-        Create a payment method handler instance.
+        Get the payment method handler instance.
+
+        Handlers are stateless, so the same shared instance is returned for
+        every call with a given payment method.
 
         Args:
             payment_method: The payment method enum value
@@ -76,15 +86,15 @@ class PaymentMethodFactory:
         Raises:
             PaymentMethodError: If the payment method is not supported
         """
-        if payment_method not in PAYMENT_METHODS:
+        # Single dict lookup; the enum member was already validated by the schema
+        handler = _HANDLER_INSTANCES.get(payment_method)
+        if handler is None:
             raise PaymentMethodError(
                 f"Unsupported payment method: {payment_method.value}. "
-                f"Supported methods are: {', '.join(m.value for m in PAYMENT_METHODS)}",
+                f"Supported methods are: {', '.join(_SUPPORTED_NAMES)}",
                 field="paymentMethod",
             )
-
-        handler_class = PAYMENT_METHODS[payment_method]
-        return handler_class()
+        return handler
 
     @staticmethod
     def get_supported_methods() -> list[str]:
@@ -94,19 +104,27 @@ class PaymentMethodFactory:
         Returns:
             list[str]: List of payment method enum values
         """
-        return [method.value for method in PAYMENT_METHODS]
+        return list(_SUPPORTED_NAMES)
 
 
 def get_payment_method(payment_method: PaymentMethod) -> BasePaymentMethod:
     """
     Convenience function to get a payment method handler.
 
-    This is a shortcut for PaymentMethodFactory.create() for simpler imports.
+    Equivalent to PaymentMethodFactory.create(), for simpler imports.
 
     Args:
         payment_method: The payment method enum value
 
     Returns:
         BasePaymentMethod: Instance of the appropriate payment handler
+
+    Raises:
+        PaymentMethodError: If the payment method is not supported
     """
-    return PaymentMethodFactory.create(payment_method)
+    # Hot path for every payment: index the singleton table directly and only
+    # go through the factory to build the error for unknown methods
+    handler = _HANDLER_INSTANCES.get(payment_method)
+    if handler is None:
+        return PaymentMethodFactory.create(payment_method)
+    return handler
@@ -22,11 +22,39 @@ Payment Methods Overview:
 | CHEQUE          | 0.9 - 1.0      | 0%     | bank, cheque_number          |
 """
 
-import re
 from decimal import Decimal
 
 from app.payment_methods.base import BasePaymentMethod, PaymentMethodError
 
+# Static validation messages, shared by the required_additional_fields tables
+_ERR_COURIER_MISSING = (
+    "Cash on delivery requires a courier service. Please provide 'courier' in additionalItem."
+)
+_ERR_LAST4_MISSING = (
+    "Card payments require the last 4 digits of the card. "
+    "Please provide 'last4' in additionalItem."
+)
+_ERR_BANK_TRANSFER_MISSING = (
+    "Bank transfer requires bank and account_number. Please provide them in additionalItem."
+)
+_ERR_BANK_TRANSFER_BANK_MISSING = (
+    "Bank transfer requires the bank name. Please provide 'bank' in additionalItem."
+)
+_ERR_ACCOUNT_NUMBER_MISSING = (
+    "Bank transfer requires the account number. "
+    "Please provide 'account_number' in additionalItem."
+)
+_ERR_CHEQUE_MISSING = (
+    "Cheque payment requires bank and cheque_number. Please provide them in additionalItem."
+)
+_ERR_CHEQUE_BANK_MISSING = (
+    "Cheque payment requires the bank name. Please provide 'bank' in additionalItem."
+)
+_ERR_CHEQUE_NUMBER_MISSING = (
+    "Cheque payment requires the cheque number. "
+    "Please provide 'cheque_number' in additionalItem."
+)
+
 
 class CashPayment(BasePaymentMethod):
     """
@@ -37,14 +65,12 @@ class CashPayment(BasePaymentMethod):
     - No additional data required
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("0.9")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.05")
 
-    def validate_additional_item(self, additional_item: dict | None) -> dict:
-        """Cash payments don't require additional data."""
-        return additional_item or {}
-
 
 class CashOnDeliveryPayment(BasePaymentMethod):
     """
@@ -55,39 +81,32 @@ class CashOnDeliveryPayment(BasePaymentMethod):
     - Requires courier service selection (YAMATO or SAGAWA only)
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("1.0")
     max_modifier = Decimal("1.02")
     points_rate = Decimal("0.05")
 
-    # Valid courier services for COD
-    VALID_COURIERS = {"YAMATO", "SAGAWA"}
+    # Valid courier services for COD, and the list quoted in the error message
+    VALID_COURIERS = frozenset({"YAMATO", "SAGAWA"})
+    _VALID_COURIERS_ERR = ", ".join(sorted(VALID_COURIERS))
 
-    def validate_additional_item(self, additional_item: dict | None) -> dict:
-        """
-        Validate courier service selection.
+    required_additional_fields = (("courier", _ERR_COURIER_MISSING),)
 
-        Args:
-            additional_item: Must contain {"courier": "YAMATO"} or {"courier": "SAGAWA"}
-
-        Raises:
-            PaymentMethodError: If courier is missing or invalid
-        """
-        if not additional_item or "courier" not in additional_item:
-            raise PaymentMethodError(
-                "Cash on delivery requires a courier service. "
-                "Please provide 'courier' in additionalItem.",
-                field="additionalItem.courier",
-            )
-
-        courier = additional_item["courier"].upper()
+    def clean_additional_value(self, key: str, value: object) -> str:
+        """Normalize the courier to upper case and check it is supported."""
+        courier = str(value)
+        # Clients normally send the canonical upper-case name, which matches
+        # as-is; only other spellings pay for the upper() copy
         if courier not in self.VALID_COURIERS:
-            raise PaymentMethodError(
-                f"Invalid courier service '{courier}'. "
-                f"Valid options are: {', '.join(sorted(self.VALID_COURIERS))}",
-                field="additionalItem.courier",
-            )
-
-        return {"courier": courier}
+            courier = courier.upper()
+            if courier not in self.VALID_COURIERS:
+                raise PaymentMethodError(
+                    f"Invalid courier service '{courier}'. "
+                    f"Valid options are: {self._VALID_COURIERS_ERR}",
+                    field="additionalItem.courier",
+                )
+        return courier
 
 
 class CardPaymentBase(BasePaymentMethod):
@@ -98,33 +117,23 @@ class CardPaymentBase(BasePaymentMethod):
     for identification and receipt purposes.
     """
 
-    def validate_additional_item(self, additional_item: dict | None) -> dict:
-        """
-        Validate card's last 4 digits.
-
-        Args:
-            additional_item: Must contain {"last4": "1234"}
+    __slots__ = ()
 
-        Raises:
-            PaymentMethodError: If last4 is missing or not exactly 4 digits
-        """
-        if not additional_item or "last4" not in additional_item:
-            raise PaymentMethodError(
-                "Card payments require the last 4 digits of the card. "
-                "Please provide 'last4' in additionalItem.",
-                field="additionalItem.last4",
-            )
+    required_additional_fields = (("last4", _ERR_LAST4_MISSING),)
 
-        last4 = str(additional_item["last4"])
+    def clean_additional_value(self, key: str, value: object) -> str:
+        """Check last4 is exactly 4 digits."""
+        last4 = str(value)
 
-        # Validate format: exactly 4 digits
-        if not re.match(r"^\d{4}$", last4):
+        # Validate format: exactly 4 ASCII digits. String methods avoid the regex
+        # engine; isascii() rules out other Unicode digits isdigit() accepts
+        if len(last4) != 4 or not (last4.isascii() and last4.isdigit()):
             raise PaymentMethodError(
                 f"Invalid card last4 format '{last4}'. Must be exactly 4 digits.",
                 field="additionalItem.last4",
             )
 
-        return {"last4": last4}
+        return last4
 
 
 class VisaPayment(CardPaymentBase):
@@ -136,6 +145,8 @@ class VisaPayment(CardPaymentBase):
     - Requires last 4 digits of card
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("0.95")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.03")
@@ -150,6 +161,8 @@ class MastercardPayment(CardPaymentBase):
     - Requires last 4 digits of card
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("0.95")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.03")
@@ -165,6 +178,8 @@ class AmexPayment(CardPaymentBase):
     - Requires last 4 digits of card
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("0.98")
     max_modifier = Decimal("1.01")
     points_rate = Decimal("0.02")
@@ -179,6 +194,8 @@ class JcbPayment(CardPaymentBase):
     - Requires last 4 digits of card
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("0.95")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.05")
@@ -193,14 +210,12 @@ class LinePayPayment(BasePaymentMethod):
     - No additional data required
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("1.0")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.01")
 
-    def validate_additional_item(self, additional_item: dict | None) -> dict:
-        """LINE Pay doesn't require additional data."""
-        return additional_item or {}
-
 
 class PayPayPayment(BasePaymentMethod):
     """
@@ -211,14 +226,12 @@ class PayPayPayment(BasePaymentMethod):
     - No additional data required
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("1.0")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.01")
 
-    def validate_additional_item(self, additional_item: dict | None) -> dict:
-        """PayPay doesn't require additional data."""
-        return additional_item or {}
-
 
 class PointsPayment(BasePaymentMethod):
     """
@@ -230,14 +243,12 @@ class PointsPayment(BasePaymentMethod):
     - No additional data required
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("1.0")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.0")
 
-    def validate_additional_item(self, additional_item: dict | None) -> dict:
-        """Points payment doesn't require additional data."""
-        return additional_item or {}
-
 
 class GrabPayPayment(BasePaymentMethod):
     """
@@ -248,14 +259,12 @@ class GrabPayPayment(BasePaymentMethod):
     - No additional data required
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("1.0")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.01")
 
-    def validate_additional_item(self, additional_item: dict | None) -> dict:
-        """GrabPay doesn't require additional data."""
-        return additional_item or {}
-
 
 class BankTransferPayment(BasePaymentMethod):
     """
@@ -266,44 +275,17 @@ class BankTransferPayment(BasePaymentMethod):
     - Requires bank name and account number for record keeping
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("1.0")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.0")
 
-    def validate_additional_item(self, additional_item: dict | None) -> dict:
-        """
-        Validate bank transfer details.
-
-        Args:
-            additional_item: Must contain {"bank": "...", "account_number": "..."}
-
-        Raises:
-            PaymentMethodError: If bank or account_number is missing
-        """
-        if not additional_item:
-            raise PaymentMethodError(
-                "Bank transfer requires bank and account_number. "
-                "Please provide them in additionalItem.",
-                field="additionalItem",
-            )
-
-        if "bank" not in additional_item or not additional_item["bank"]:
-            raise PaymentMethodError(
-                "Bank transfer requires the bank name. " "Please provide 'bank' in additionalItem.",
-                field="additionalItem.bank",
-            )
-
-        if "account_number" not in additional_item or not additional_item["account_number"]:
-            raise PaymentMethodError(
-                "Bank transfer requires the account number. "
-                "Please provide 'account_number' in additionalItem.",
-                field="additionalItem.account_number",
-            )
-
-        return {
-            "bank": str(additional_item["bank"]).strip(),
-            "account_number": str(additional_item["account_number"]).strip(),
-        }
+    required_additional_fields = (
+        ("bank", _ERR_BANK_TRANSFER_BANK_MISSING),
+        ("account_number", _ERR_ACCOUNT_NUMBER_MISSING),
+    )
+    missing_additional_item_error = _ERR_BANK_TRANSFER_MISSING
 
 
 class ChequePayment(BasePaymentMethod):
@@ -315,42 +297,14 @@ class ChequePayment(BasePaymentMethod):
     - Requires bank name and cheque number for verification
     """
 
+    __slots__ = ()
+
     min_modifier = Decimal("0.9")
     max_modifier = Decimal("1.0")
     points_rate = Decimal("0.0")
 
-    def validate_additional_item(self, additional_item: dict | None) -> dict:
-        """
-        Validate cheque details.
-
-        Args:
-            additional_item: Must contain {"bank": "...", "cheque_number": "..."}
-
-        Raises:
-            PaymentMethodError: If bank or cheque_number is missing
-        """
-        if not additional_item:
-            raise PaymentMethodError(
-                "Cheque payment requires bank and cheque_number. "
-                "Please provide them in additionalItem.",
-                field="additionalItem",
-            )
-
-        if "bank" not in additional_item or not additional_item["bank"]:
-            raise PaymentMethodError(
-                "Cheque payment requires the bank name. "
-                "Please provide 'bank' in additionalItem.",
-                field="additionalItem.bank",
-            )
-
-        if "cheque_number" not in additional_item or not additional_item["cheque_number"]:
-            raise PaymentMethodError(
-                "Cheque payment requires the cheque number. "
-                "Please provide 'cheque_number' in additionalItem.",
-                field="additionalItem.cheque_number",
-            )
-
-        return {
-            "bank": str(additional_item["bank"]).strip(),
-            "cheque_number": str(additional_item["cheque_number"]).strip(),
-        }
+    required_additional_fields = (
+        ("bank", _ERR_CHEQUE_BANK_MISSING),
+        ("cheque_number", _ERR_CHEQUE_NUMBER_MISSING),
+    )
+    missing_additional_item_error = _ERR_CHEQUE_MISSING
@@ -6,25 +6,70 @@ It orchestrates between the database layer and payment method strategies.
 
 Responsibilities:
 - Process payment requests with validation
-- Store payment records in the database
+- Store payment records in the database, singly or in batches
 - Generate hourly sales reports within date ranges
 
 Design Decisions:
 1. Async operations for scalability under concurrent requests
 2. Decimal precision for all monetary calculations
-3. Hourly aggregation for sales reports using SQL window functions
+3. Hourly aggregation and formatting for sales reports done in SQL
 """
 
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import NamedTuple
 
-from sqlalchemy import func, select
+from sqlalchemy import String, cast, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.payment import Payment, PaymentMethod
 from app.payment_methods import get_payment_method
 from app.payment_methods.base import PaymentMethodError
 
+# Plain dict lookup instead of the Enum metaclass call when parsing method
+# names, plus the error-message list built once
+_PAYMENT_METHOD_BY_VALUE: dict[str, PaymentMethod] = {m.value: m for m in PaymentMethod}
+_VALID_METHODS_STR = ", ".join(_PAYMENT_METHOD_BY_VALUE)
+
+# Client-supplied numbers are bounded before any arithmetic on them: pricing
+# works on exact integer ratios, so an exponent like 1E-50000000 would build
+# a 50-million-digit integer and stall the event loop. Prices must fit the
+# NUMERIC(10, 2) column; modifiers get a loose bound, the handlers' range
+# check does the rest
+_MAX_PRICE = Decimal("99999999.99")
+_CENT = Decimal("0.01")
+_MAX_MODIFIER_ADJUSTED_EXPONENT = 1
+_MIN_MODIFIER_EXPONENT = -20
+
+# Sales report hours are rendered by to_char() in ISO 8601 with a Z suffix
+_ISO_UTC_HOUR_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS"Z"'
+
+
+# Longest string _to_decimal memoizes: "99999999.99" fits with room to spare
+_MAX_CACHED_DECIMAL_LENGTH = 20
+
+
+@lru_cache(maxsize=4096)
+def _cached_decimal(value: str) -> Decimal:
+    """Parse a short decimal string, memoized."""
+    return Decimal(value)
+
+
+def _to_decimal(value: str) -> Decimal:
+    """
+    Parse a decimal string, memoizing short ones.
+
+    Prices and modifiers repeat heavily across requests (modifiers come from a
+    handful of values), and Decimals are immutable, so parsed values can be
+    shared. Only short strings are cached, so clients can't pin arbitrarily
+    large keys in the cache. Invalid input raises InvalidOperation and is not
+    cached.
+    """
+    if len(value) > _MAX_CACHED_DECIMAL_LENGTH:
+        return Decimal(value)
+    return _cached_decimal(value)
+
 
 class PaymentServiceError(Exception):
     """
@@ -39,6 +84,19 @@ class PaymentServiceError(Exception):
         super().__init__(self.message)
 
 
+class HourlySalesRow(NamedTuple):
+    """
+    One hour of aggregated sales data.
+
+    Field names match the GraphQL HourlySales type, so rows can be returned
+    from resolvers as-is without an intermediate conversion.
+    """
+
+    datetime: str
+    sales: str
+    points: int
+
+
 class PaymentService:
     """
     Service class for payment operations.
@@ -64,7 +122,7 @@ class PaymentService:
         customer_id: str,
         price: str,
         price_modifier: float,
-        payment_method: str,
+        payment_method: PaymentMethod | str,
         transaction_datetime: datetime,
         additional_item: dict | None = None,
     ) -> dict:
@@ -81,7 +139,7 @@ class PaymentService:
             customer_id: Unique identifier for the customer
             price: Original price as string (e.g., "100.00")
             price_modifier: Price modifier to apply (e.g., 0.95 for 5% off)
-            payment_method: Payment method name (e.g., "VISA")
+            payment_method: Payment method enum member, or its name (e.g., "VISA")
             transaction_datetime: When the payment was made
             additional_item: Payment-specific additional data
 
@@ -94,34 +152,107 @@ class PaymentService:
         Raises:
             PaymentServiceError: If validation fails or processing errors occur
         """
+        values = self._build_payment_values(
+            customer_id=customer_id,
+            price=price,
+            price_modifier=price_modifier,
+            payment_method=payment_method,
+            transaction_datetime=transaction_datetime,
+            additional_item=additional_item,
+        )
+
+        self.db.add(Payment(**values))
+        await self.db.flush()
+
+        return {"final_price": str(values["final_price"]), "points": values["points"]}
+
+    async def process_payments(self, items: list[dict]) -> list[dict]:
+        """
+        Process a batch of payment transactions with a single INSERT.
+
+        Every item is validated and priced first, exactly as process_payment
+        would, and the rows are then written in one executemany round trip
+        instead of one INSERT per payment. If any item is invalid nothing is
+        written.
+
+        Args:
+            items: process_payment keyword arguments, one dict per payment
+
+        Returns:
+            list[dict]: One {"final_price", "points"} result per item, in order
+
+        Raises:
+            PaymentServiceError: If any item fails validation
+        """
+        rows = [self._build_payment_values(**item) for item in items]
+        if rows:
+            await self.db.execute(insert(Payment), rows)
+
+        return [{"final_price": str(row["final_price"]), "points": row["points"]} for row in rows]
+
+    def _build_payment_values(
+        self,
+        customer_id: str,
+        price: str,
+        price_modifier: float,
+        payment_method: PaymentMethod | str,
+        transaction_datetime: datetime,
+        additional_item: dict | None = None,
+    ) -> dict:
+        """
+        Validate one payment and compute the column values to store.
+
+        Takes the same arguments as process_payment.
+
+        Returns:
+            dict: Payment column values, including final_price and points
+
+        Raises:
+            PaymentServiceError: If validation fails
+        """
         if not customer_id or not customer_id.strip():
             raise PaymentServiceError("Customer ID is required", field="customerId")
 
         try:
-            price_decimal = Decimal(price)
-            if price_decimal <= 0:
-                raise PaymentServiceError("Price must be greater than zero", field="price")
+            price_decimal = _to_decimal(price)
+            if not price_decimal.is_finite():
+                raise InvalidOperation
         except (InvalidOperation, ValueError):
             raise PaymentServiceError(
                 f"Invalid price format: {price}. Must be a valid decimal number.", field="price"
             ) from None
+        if price_decimal <= 0:
+            raise PaymentServiceError("Price must be greater than zero", field="price")
+        if price_decimal > _MAX_PRICE:
+            raise PaymentServiceError(f"Price must not exceed {_MAX_PRICE}", field="price")
+        # Bounded by the checks above, so the quantize itself is cheap
+        if price_decimal != price_decimal.quantize(_CENT):
+            raise PaymentServiceError("Price must have at most 2 decimal places", field="price")
 
         try:
-            modifier_decimal = Decimal(str(price_modifier))
+            modifier_decimal = _to_decimal(str(price_modifier))
+            if not (
+                modifier_decimal.is_finite()
+                and modifier_decimal.adjusted() <= _MAX_MODIFIER_ADJUSTED_EXPONENT
+                and modifier_decimal.as_tuple().exponent >= _MIN_MODIFIER_EXPONENT
+            ):
+                raise InvalidOperation
         except (InvalidOperation, ValueError):
             raise PaymentServiceError(
                 f"Invalid price modifier: {price_modifier}", field="priceModifier"
             ) from None
 
-        try:
-            payment_method_enum = PaymentMethod(payment_method)
-        except ValueError:
-            valid_methods = [m.value for m in PaymentMethod]
-            raise PaymentServiceError(
-                f"Invalid payment method: {payment_method}. "
-                f"Valid methods are: {', '.join(valid_methods)}",
-                field="paymentMethod",
-            ) from None
+        # Callers holding the enum already (e.g. the GraphQL resolver) skip the parse
+        if isinstance(payment_method, PaymentMethod):
+            payment_method_enum = payment_method
+        else:
+            payment_method_enum = _PAYMENT_METHOD_BY_VALUE.get(payment_method)
+            if payment_method_enum is None:
+                raise PaymentServiceError(
+                    f"Invalid payment method: {payment_method}. "
+                    f"Valid methods are: {_VALID_METHODS_STR}",
+                    field="paymentMethod",
+                )
 
         try:
             handler = get_payment_method(payment_method_enum)
@@ -133,27 +264,22 @@ class PaymentService:
         except PaymentMethodError as e:
             raise PaymentServiceError(e.message, e.field) from None
 
-        payment = Payment(
-            customer_id=customer_id.strip(),
-            price=price_decimal,
-            price_modifier=modifier_decimal,
-            final_price=final_price,
-            points=points,
-            payment_method=payment_method_enum.value,
-            additional_item=validated_additional_item,
-            datetime=transaction_datetime,
-        )
-
-        self.db.add(payment)
-        await self.db.flush()
-
-        return {"final_price": str(final_price), "points": points}
+        return {
+            "customer_id": customer_id.strip(),
+            "price": price_decimal,
+            "price_modifier": modifier_decimal,
+            "final_price": final_price,
+            "points": points,
+            "payment_method": payment_method_enum,
+            "additional_item": validated_additional_item,
+            "datetime": transaction_datetime,
+        }
 
     async def get_sales_report(
         self,
         start_datetime: datetime,
         end_datetime: datetime,
-    ) -> list[dict]:
+    ) -> list[HourlySalesRow]:
         """
         Get hourly sales report within a date range.
 
@@ -165,8 +291,8 @@ class PaymentService:
             end_datetime: End of the date range (inclusive)
 
         Returns:
-            List[dict]: List of hourly sales data, each containing:
-                - datetime: ISO format string of the hour
+            list[HourlySalesRow]: List of hourly sales data, each containing:
+                - datetime: ISO format string of the UTC hour
                 - sales: Total sales amount for that hour
                 - points: Total points awarded that hour
 
@@ -178,13 +304,17 @@ class PaymentService:
                 "Start datetime must be before end datetime", field="startDateTime"
             )
 
-        hour_trunc = func.date_trunc("hour", Payment.datetime)
+        # Bucket by UTC hour regardless of the session time zone, and let the
+        # database render the response strings so rows need no per-row
+        # formatting in Python. sum() of a NUMERIC(10, 2) column keeps scale 2,
+        # so its text form is already "95.00"
+        hour_trunc = func.date_trunc("hour", func.timezone("UTC", Payment.datetime))
 
         query = (
             select(
-                hour_trunc.label("hour"),
-                func.sum(Payment.final_price).label("total_sales"),
-                func.sum(Payment.points).label("total_points"),
+                func.to_char(hour_trunc, _ISO_UTC_HOUR_FORMAT).label("datetime"),
+                cast(func.sum(Payment.final_price), String).label("sales"),
+                func.sum(Payment.points).label("points"),
             )
             .where(Payment.datetime >= start_datetime)
             .where(Payment.datetime <= end_datetime)
@@ -192,17 +322,10 @@ class PaymentService:
             .order_by(hour_trunc)
         )
 
-        result = await self.db.execute(query)
-        rows = result.all()
-
-        sales_report = []
-        for row in rows:
-            sales_report.append(
-                {
-                    "datetime": row.hour.isoformat().replace("+00:00", "Z"),
-                    "sales": f"{row.total_sales:.2f}",
-                    "points": int(row.total_points),
-                }
-            )
+        # Plain Core aggregation: run it on the session's connection directly
+        # to skip ORM execution. At most one row per hour comes back, so it is
+        # fetched in one go rather than through a server-side cursor
+        connection = await self.db.connection()
+        result = await connection.execute(query)
 
-        return sales_report
+        return [HourlySalesRow._make(row) for row in result]
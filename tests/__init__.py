@@ -5,7 +5,12 @@ This package contains all tests for the AnyMind POS Payment System.
 
 Test Structure:
 - conftest.py: Pytest fixtures for database and client setup
+- graphql_documents.py: GraphQL documents and inputs shared by the API tests
 - test_payment_methods.py: Unit tests for payment method strategies
 - test_payment_service.py: Integration tests for payment service
 - test_graphql.py: End-to-end tests for GraphQL API
+- test_circuit_breaker.py: Unit tests for the database circuit breaker
+- test_cors.py: Unit tests for the CORS middleware
+- test_partitions.py: Integration tests for monthly payment partitions
+- test_models.py: Unit tests for the Payment model
 """
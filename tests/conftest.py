@@ -3,13 +3,15 @@ Pytest Configuration and Fixtures
 
 This module provides shared fixtures for all tests:
 - Database setup with PostgreSQL for full compatibility
-- Test client for HTTP/GraphQL requests
+- Test clients for HTTP/GraphQL requests, with or without a database
 - Sample data generators
 
 Using PostgreSQL for tests to ensure full compatibility with production.
 """
 
-from collections.abc import AsyncGenerator
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Generator
 from datetime import UTC, datetime
 from decimal import Decimal
 from unittest.mock import patch
@@ -17,10 +19,19 @@ from unittest.mock import patch
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
 from app.config import get_settings
 from app.database import Base
+from app.graphql.context import GraphQLContext
 from app.main import app
 from app.models.payment import Payment, PaymentMethod
 
@@ -28,140 +39,214 @@ settings = get_settings()
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    import asyncio
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """
+    Run async tests on uvloop, the loop the app is served with in production.
 
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+    uvloop comes with uvicorn[standard] everywhere except Windows, where the
+    default asyncio policy is kept.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
 
 
-@pytest_asyncio.fixture
-async def test_engine():
+async def _reset_schema(engine: AsyncEngine, create: bool) -> None:
+    """Drop the test tables and optionally create them again."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        if create:
+            await conn.run_sync(Base.metadata.create_all)
+
+
+@pytest.fixture(scope="session")
+def test_engine():
     """
     Create a test database engine.
 
     Uses PostgreSQL for full compatibility with production.
-    Creates fresh tables for each test.
+    Creates the tables once per test session; tests are isolated by rolling
+    back their transaction (see db_connection) rather than recreating tables.
     """
+    # NullPool: asyncpg connections are bound to the event loop that opened
+    # them, so nothing is kept between the setup loop and the tests' loops
     engine = create_async_engine(
         settings.TEST_DATABASE_URL,
         echo=False,
+        poolclass=NullPool,
     )
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Also clears leftovers from an interrupted run
+    asyncio.run(_reset_schema(engine, create=True))
 
     yield engine
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
-    await engine.dispose()
+    asyncio.run(_reset_schema(engine, create=False))
 
 
 @pytest_asyncio.fixture
-async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
+async def db_connection(test_engine) -> AsyncGenerator[AsyncConnection, None]:
     """
-    Create a test database session.
+    Open a connection inside a transaction that is rolled back after the test.
 
-    Provides an isolated session for each test that is rolled back
-    after the test completes.
+    Every session a test uses is bound to this connection and joins its
+    transaction through savepoints, so commits (including the app's) are
+    visible for the rest of the test but never persist.
     """
-    TestSessionLocal = async_sessionmaker(
-        bind=test_engine,
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+
+
+def _session_factory(db_connection: AsyncConnection) -> async_sessionmaker[AsyncSession]:
+    """Build a session factory whose sessions join the test's transaction."""
+    return async_sessionmaker(
+        bind=db_connection,
         class_=AsyncSession,
         expire_on_commit=False,
-        autocommit=False,
-        autoflush=False,
+        join_transaction_mode="create_savepoint",
     )
 
-    async with TestSessionLocal() as session:
+
+@pytest_asyncio.fixture
+async def test_session(db_connection) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a test database session.
+
+    Provides an isolated session for each test that is rolled back
+    after the test completes.
+    """
+    async with _session_factory(db_connection)(autoflush=False) as session:
         yield session
         await session.rollback()
 
 
+@pytest.fixture(scope="session")
+def asgi_client() -> Generator[AsyncClient, None, None]:
+    """
+    Create one async HTTP client over the ASGI app for the whole test session.
+
+    The transport calls the app in-process and holds no connections, so the
+    client is safe to share; per-test state lives in test_client and app_client.
+    """
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    yield client
+    asyncio.run(client.aclose())
+
+
 @pytest_asyncio.fixture
-async def test_client(test_engine) -> AsyncGenerator[AsyncClient, None]:
+async def test_client(asgi_client, db_connection) -> AsyncGenerator[AsyncClient, None]:
     """
-    Create an async test client for HTTP requests.
+    Provide the shared async test client, wired to this test's transaction.
 
     This client can be used to test the FastAPI endpoints
     including the GraphQL endpoint.
     """
-    TestSessionLocal = async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    with patch("app.main.AsyncSessionLocal", _session_factory(db_connection)):
+        yield asgi_client
+
+
+@pytest.fixture
+def app_client(asgi_client) -> Generator[AsyncClient, None, None]:
+    """
+    Provide the shared async test client for requests that never reach the database.
+
+    Meant for validation errors and static queries: no connection or test
+    transaction is set up. Sessions the app opens are unbound, so a request
+    that does run a statement fails instead of silently using a database.
+    """
+    with patch("app.main.AsyncSessionLocal", async_sessionmaker(class_=AsyncSession)):
+        yield asgi_client
+
+
+@pytest.fixture
+def graphql_context() -> GraphQLContext:
+    """
+    Create a GraphQL context for executing operations on the schema directly.
 
-    with patch("app.main.AsyncSessionLocal", TestSessionLocal):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            yield client
+    Like app_client, its sessions are unbound, so it suits operations that
+    are rejected or answered before any database access.
+    """
+    return GraphQLContext(session_factory=async_sessionmaker(class_=AsyncSession))
+
+
+# Built once and copied into the payments table by the sample_payments fixture
+_SAMPLE_PAYMENT_KWARGS = (
+    {
+        "customer_id": "customer1",
+        "price": Decimal("100.00"),
+        "price_modifier": Decimal("0.95"),
+        "final_price": Decimal("95.00"),
+        "points": 3,
+        "payment_method": PaymentMethod.VISA.value,
+        "additional_item": {"last4": "1234"},
+        "datetime": datetime(2022, 9, 1, 0, 30, tzinfo=UTC),
+    },
+    {
+        "customer_id": "customer2",
+        "price": Decimal("200.00"),
+        "price_modifier": Decimal("1.0"),
+        "final_price": Decimal("200.00"),
+        "points": 10,
+        "payment_method": PaymentMethod.CASH.value,
+        "additional_item": {},
+        "datetime": datetime(2022, 9, 1, 0, 45, tzinfo=UTC),
+    },
+    {
+        "customer_id": "customer1",
+        "price": Decimal("150.00"),
+        "price_modifier": Decimal("1.0"),
+        "final_price": Decimal("150.00"),
+        "points": 7,
+        "payment_method": PaymentMethod.CASH_ON_DELIVERY.value,
+        "additional_item": {"courier": "YAMATO"},
+        "datetime": datetime(2022, 9, 1, 1, 15, tzinfo=UTC),
+    },
+    {
+        "customer_id": "customer3",
+        "price": Decimal("500.00"),
+        "price_modifier": Decimal("0.98"),
+        "final_price": Decimal("490.00"),
+        "points": 10,
+        "payment_method": PaymentMethod.AMEX.value,
+        "additional_item": {"last4": "5678"},
+        "datetime": datetime(2022, 9, 1, 2, 0, tzinfo=UTC),
+    },
+)
+
+
+_SAMPLE_PAYMENT_COLUMNS = tuple(_SAMPLE_PAYMENT_KWARGS[0])
 
 
 @pytest_asyncio.fixture
-async def sample_payments(test_engine) -> list[Payment]:
+async def sample_payments(db_connection) -> list[Payment]:
     """
     Create sample payment records for testing.
 
     Returns a list of payments with various methods and amounts
     for use in sales report tests.
     """
-    TestSessionLocal = async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    payments = [
-        Payment(
-            customer_id="customer1",
-            price=Decimal("100.00"),
-            price_modifier=Decimal("0.95"),
-            final_price=Decimal("95.00"),
-            points=3,
-            payment_method=PaymentMethod.VISA.value,
-            additional_item={"last4": "1234"},
-            datetime=datetime(2022, 9, 1, 0, 30, tzinfo=UTC),
-        ),
-        Payment(
-            customer_id="customer2",
-            price=Decimal("200.00"),
-            price_modifier=Decimal("1.0"),
-            final_price=Decimal("200.00"),
-            points=10,
-            payment_method=PaymentMethod.CASH.value,
-            additional_item={},
-            datetime=datetime(2022, 9, 1, 0, 45, tzinfo=UTC),
-        ),
-        Payment(
-            customer_id="customer1",
-            price=Decimal("150.00"),
-            price_modifier=Decimal("1.0"),
-            final_price=Decimal("150.00"),
-            points=7,
-            payment_method=PaymentMethod.CASH_ON_DELIVERY.value,
-            additional_item={"courier": "YAMATO"},
-            datetime=datetime(2022, 9, 1, 1, 15, tzinfo=UTC),
-        ),
-        Payment(
-            customer_id="customer3",
-            price=Decimal("500.00"),
-            price_modifier=Decimal("0.98"),
-            final_price=Decimal("490.00"),
-            points=10,
-            payment_method=PaymentMethod.AMEX.value,
-            additional_item={"last4": "5678"},
-            datetime=datetime(2022, 9, 1, 2, 0, tzinfo=UTC),
-        ),
+    # One binary COPY instead of an INSERT per row; JSONB goes over as text
+    records = [
+        tuple(
+            json.dumps(kwargs[column]) if column == "additional_item" else kwargs[column]
+            for column in _SAMPLE_PAYMENT_COLUMNS
+        )
+        for kwargs in _SAMPLE_PAYMENT_KWARGS
     ]
-
-    async with TestSessionLocal() as session:
-        for payment in payments:
-            session.add(payment)
+    async with _session_factory(db_connection)() as session:
+        # Join the test transaction first: the driver only opens it lazily on
+        # the first statement, and a COPY before that would autocommit
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Payment.__tablename__, records=records, columns=_SAMPLE_PAYMENT_COLUMNS
+        )
         await session.commit()
 
-    return payments
+        # COPY returns nothing, so load the rows back (ids follow copy order)
+        payments = await session.scalars(select(Payment).order_by(Payment.id))
+        return list(payments)
@@ -0,0 +1,83 @@
+"""
+Shared GraphQL Documents for the Tests
+
+GraphQL documents and input builders used by both the HTTP tests in
+test_graphql.py and the schema-level tests in test_schema.py. Kept out of
+the test modules so neither has to import the other.
+"""
+
+CREATE_PAYMENT_MUTATION = """
+    mutation CreatePayment($input: PaymentInput!) {
+        createPayment(input: $input) {
+            ... on PaymentResponse {
+                finalPrice
+                points
+            }
+            ... on ErrorResponse {
+                error
+                message
+                field
+            }
+        }
+    }
+"""
+
+SALES_REPORT_QUERY = """
+    query SalesReport($input: SalesReportInput!) {
+        salesReport(input: $input) {
+            ... on SalesReportResponse {
+                sales {
+                    datetime
+                    sales
+                    points
+                }
+            }
+            ... on ErrorResponse {
+                error
+                message
+            }
+        }
+    }
+"""
+
+# Strawberry 0.217 has no HTTP batching, so several reports are fetched in
+# one request as aliased fields of a single document instead
+SALES_REPORT_BATCH_QUERY = """
+    query SalesReports(
+        $withData: SalesReportInput!
+        $empty: SalesReportInput!
+        $invalid: SalesReportInput!
+    ) {
+        withData: salesReport(input: $withData) { ...Report }
+        empty: salesReport(input: $empty) { ...Report }
+        invalid: salesReport(input: $invalid) { ...Report }
+    }
+
+    fragment Report on SalesReportResult {
+        ... on SalesReportResponse {
+            sales {
+                datetime
+                sales
+                points
+            }
+        }
+        ... on ErrorResponse {
+            error
+            message
+        }
+    }
+"""
+
+SUPPORTED_METHODS_QUERY = "query { supportedPaymentMethods }"
+
+
+def payment_input(overrides: dict) -> dict:
+    """Build a createPayment input: a plain cash payment with `overrides` applied."""
+    return {
+        "customerId": "12345",
+        "price": "100.00",
+        "priceModifier": 1.0,
+        "paymentMethod": "CASH",
+        "datetime": "2022-09-01T00:00:00Z",
+        **overrides,
+    }
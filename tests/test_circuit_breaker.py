@@ -0,0 +1,115 @@
+"""
+Unit Tests for the Circuit Breaker
+
+Tests the circuit breaker guarding database-backed service calls:
+- Opening after consecutive failures
+- Ignored exceptions not counting as failures
+- Half-open behaviour once the reset period elapses
+- Cancelled calls not counting either way
+"""
+
+import asyncio
+
+import pytest
+
+from app.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.payment_service import PaymentServiceError
+
+pytestmark = pytest.mark.asyncio
+
+
+async def fail(breaker: CircuitBreaker, exc: BaseException) -> None:
+    """Run a guarded call that raises the given exception."""
+    with pytest.raises(type(exc)):
+        async with breaker:
+            raise exc
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    async def test_opens_after_threshold_failures(self):
+        """Test calls are rejected once the failure threshold is reached."""
+        breaker = CircuitBreaker(threshold=2, reset_s=30)
+        await fail(breaker, TimeoutError())
+        assert not breaker.is_open
+
+        await fail(breaker, TimeoutError())
+        assert breaker.is_open
+
+        with pytest.raises(CircuitOpenError):
+            async with breaker:
+                pass
+
+    async def test_success_resets_failure_count(self):
+        """Test a successful call clears consecutive failures."""
+        breaker = CircuitBreaker(threshold=2, reset_s=30)
+        await fail(breaker, TimeoutError())
+
+        async with breaker:
+            pass
+
+        await fail(breaker, TimeoutError())
+        assert not breaker.is_open
+
+    async def test_ignored_exceptions_do_not_count(self):
+        """Test validation errors don't trip the breaker."""
+        breaker = CircuitBreaker(threshold=1, reset_s=30, ignored=(PaymentServiceError,))
+        await fail(breaker, PaymentServiceError("Invalid price"))
+        assert not breaker.is_open
+
+    async def test_half_open_failure_reopens(self):
+        """Test a failure after the reset period re-opens the breaker at once."""
+        breaker = CircuitBreaker(threshold=2, reset_s=0)
+        await fail(breaker, TimeoutError())
+        await fail(breaker, TimeoutError())
+
+        # reset_s=0: the breaker is half-open and lets the next call through
+        await fail(breaker, TimeoutError())
+        assert breaker.failures == 3
+
+        async with breaker:
+            pass
+        assert breaker.failures == 0
+        assert breaker.opened_at is None
+
+    async def test_half_open_allows_single_trial_call(self):
+        """Test concurrent calls are rejected while the half-open trial is in flight."""
+        breaker = CircuitBreaker(threshold=1, reset_s=0)
+        await fail(breaker, TimeoutError())
+        trial_started = asyncio.Event()
+        release_trial = asyncio.Event()
+
+        async def trial() -> None:
+            async with breaker:
+                trial_started.set()
+                await release_trial.wait()
+
+        trial_task = asyncio.create_task(trial())
+        await trial_started.wait()
+
+        with pytest.raises(CircuitOpenError):
+            async with breaker:
+                pass
+
+        release_trial.set()
+        await trial_task
+        assert breaker.opened_at is None
+
+    async def test_cancellation_does_not_count(self):
+        """Test cancelled calls (e.g. client disconnects) don't trip the breaker."""
+        breaker = CircuitBreaker(threshold=1, reset_s=30)
+        await fail(breaker, asyncio.CancelledError())
+        assert breaker.failures == 0
+        assert not breaker.is_open
+
+    async def test_cancelled_trial_frees_the_half_open_slot(self):
+        """Test a cancelled trial call lets the next call try again."""
+        breaker = CircuitBreaker(threshold=1, reset_s=0)
+        await fail(breaker, TimeoutError())
+
+        await fail(breaker, asyncio.CancelledError())
+
+        async with breaker:
+            pass
+        assert breaker.opened_at is None
@@ -0,0 +1,97 @@
+"""
+Unit Tests for the CORS Middleware
+
+Tests PureASGICORS and CombinedMiddleware against a minimal ASGI application:
+- CORS headers on regular responses
+- Preflight requests answered without reaching the application
+- Requests without an allowed origin passed through untouched
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware import CombinedMiddleware, PureASGICORS
+
+pytestmark = pytest.mark.asyncio
+
+
+async def ok_app(scope, receive, send):
+    """ASGI application answering every request with a plain 200."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def make_client(**options) -> AsyncClient:
+    """Create a client for ok_app wrapped in PureASGICORS."""
+    transport = ASGITransport(app=PureASGICORS(ok_app, **options))
+    return AsyncClient(transport=transport, base_url="http://test")
+
+
+class TestPureASGICORS:
+    """Tests for PureASGICORS request handling."""
+
+    async def test_simple_request_gets_wildcard_origin(self):
+        """Test a cross-origin request gets ACAO: * when credentials are off."""
+        async with make_client(allow_origins=["*"]) as client:
+            response = await client.post("/graphql", headers={"Origin": "https://shop.example"})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "*"
+
+    async def test_credentials_echo_origin(self):
+        """Test the origin is echoed back when credentials are allowed."""
+        async with make_client(allow_origins=["*"], allow_credentials=True) as client:
+            response = await client.post("/graphql", headers={"Origin": "https://shop.example"})
+
+        assert response.headers["access-control-allow-origin"] == "https://shop.example"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
+
+    async def test_expose_headers(self):
+        """Test exposed headers are listed on regular responses."""
+        async with make_client(allow_origins=["*"], expose_headers=["X-Request-Id"]) as client:
+            response = await client.post("/graphql", headers={"Origin": "https://shop.example"})
+
+        assert response.headers["access-control-expose-headers"] == "X-Request-Id"
+
+    async def test_preflight_answered_directly(self):
+        """Test a preflight request is answered by the middleware."""
+        async with make_client(
+            allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
+        ) as client:
+            response = await client.options(
+                "/graphql",
+                headers={
+                    "Origin": "https://shop.example",
+                    "Access-Control-Request-Method": "POST",
+                    "Access-Control-Request-Headers": "content-type, x-request-id",
+                },
+            )
+
+        assert response.status_code == 204
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-allow-headers"] == "content-type, x-request-id"
+        assert response.headers["access-control-max-age"] == "600"
+
+    async def test_disallowed_origin_passes_through(self):
+        """Test requests from other origins get no CORS headers."""
+        async with make_client(allow_origins=["https://shop.example"]) as client:
+            response = await client.post("/graphql", headers={"Origin": "https://evil.example"})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    async def test_app_installs_single_middleware(self):
+        """Test the application wraps requests in exactly one middleware layer."""
+        from app.main import app
+
+        assert [m.cls for m in app.user_middleware] == [CombinedMiddleware]
+
+    async def test_combined_middleware_adds_timing_header(self):
+        """Test CombinedMiddleware adds CORS and response time headers in one pass."""
+        transport = ASGITransport(app=CombinedMiddleware(ok_app, allow_origins=["*"]))
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/graphql", headers={"Origin": "https://shop.example"})
+
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert response.headers["x-response-time"].endswith("ms")
@@ -1,422 +1,263 @@
 """
-Integration Tests for GraphQL API
+Tests for GraphQL API
 
 Tests the complete GraphQL API including:
 - Payment mutation with various payment methods
 - Sales report query
 - Error handling and validation
 
-These tests use the full application stack with a test database.
+These tests use the full application stack; those that need the test
+database are marked as integration tests.
 """
 
+from unittest.mock import patch
+
+import orjson
 import pytest
+from httpx import AsyncClient
+
+from app.config import get_settings
+from tests.graphql_documents import (
+    CREATE_PAYMENT_MUTATION,
+    SALES_REPORT_BATCH_QUERY,
+    SALES_REPORT_QUERY,
+    SUPPORTED_METHODS_QUERY,
+    payment_input,
+)
 
 pytestmark = pytest.mark.asyncio
 
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Hourly report of the sample_payments fixture for 2022-09-01
+SAMPLE_HOURLY_SALES = [
+    {"datetime": "2022-09-01T00:00:00Z", "sales": "295.00", "points": 13},
+    {"datetime": "2022-09-01T01:00:00Z", "sales": "150.00", "points": 7},
+    {"datetime": "2022-09-01T02:00:00Z", "sales": "490.00", "points": 10},
+]
+
+
+async def execute(client: AsyncClient, query: str, variables: dict | None = None) -> dict:
+    """POST a GraphQL document with its variables and return the response JSON."""
+    # orjson both ways, like the app itself, instead of httpx's stdlib json
+    response = await client.post(
+        "/graphql",
+        content=orjson.dumps({"query": query, "variables": variables}),
+        headers=JSON_HEADERS,
+    )
+    assert response.status_code == 200
+    return orjson.loads(response.content)
 
+
+def sales_report_input(start: str, end: str) -> dict:
+    """Build salesReport variables for a datetime range."""
+    return {"input": {"startDatetime": start, "endDatetime": end}}
+
+
+@pytest.mark.smoke
 class TestHealthEndpoint:
     """Tests for the health check endpoint."""
 
-    async def test_health_check(self, test_client):
+    async def test_health_check(self, asgi_client):
         """Test health check returns healthy status."""
-        response = await test_client.get("/health")
+        # /health never touches the database, so no test transaction is needed
+        response = await asgi_client.get("/health")
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert data["status"] == "healthy"
+        # The mode comes from the environment, so compare with the configured one
+        assert data["migrations"]["mode"] == get_settings().MIGRATION_MODE
 
 
 class TestCreatePaymentMutation:
     """Tests for the createPayment GraphQL mutation."""
 
-    async def test_create_payment_mastercard(self, test_client):
-        """Test creating a payment with MASTERCARD."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "100.00"
-                    priceModifier: 0.95
-                    paymentMethod: MASTERCARD
-                    datetime: "2022-09-01T00:00:00Z"
-                    additionalItem: { last4: "1234" }
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        assert "errors" not in data
-        result = data["data"]["createPayment"]
-        assert result["finalPrice"] == "95.00"
-        assert result["points"] == 3  # 100 * 0.03
-
-    async def test_create_payment_cash_on_delivery(self, test_client):
-        """Test creating a payment with CASH_ON_DELIVERY."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "100.00"
-                    priceModifier: 1
-                    paymentMethod: CASH_ON_DELIVERY
-                    datetime: "2022-09-01T00:00:00Z"
-                    additionalItem: { courier: "YAMATO" }
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
+    @pytest.mark.parametrize(
+        "payment,expected",
+        [
+            pytest.param(
+                {
+                    "priceModifier": 0.95,
+                    "paymentMethod": "MASTERCARD",
+                    "additionalItem": {"last4": "1234"},
+                },
+                {"finalPrice": "95.00", "points": 3},  # 100 * 0.03
+                id="mastercard",
+            ),
+            pytest.param(
+                {
+                    "paymentMethod": "CASH_ON_DELIVERY",
+                    "additionalItem": {"courier": "YAMATO"},
+                },
+                {"finalPrice": "100.00", "points": 5},  # 100 * 0.05
+                id="cash-on-delivery",
+            ),
+            pytest.param(
+                {
+                    "customerId": "customer123",
+                    "price": "200.00",
+                    "priceModifier": 0.9,
+                    "datetime": "2022-09-01T10:30:00Z",
+                },
+                {"finalPrice": "180.00", "points": 10},  # 200 * 0.9, 200 * 0.05
+                id="cash",
+            ),
+            pytest.param(
+                {"price": "100.000"},
+                {"finalPrice": "100.00", "points": 5},
+                id="price-with-trailing-zeros",
+            ),
+            pytest.param(
+                {
+                    "price": "500.00",
+                    "paymentMethod": "BANK_TRANSFER",
+                    "additionalItem": {"bank": "Kasikorn Bank", "accountNumber": "1234567890"},
+                },
+                {"finalPrice": "500.00", "points": 0},  # BANK_TRANSFER gives no points
+                id="bank-transfer",
+            ),
+            pytest.param(
+                {
+                    "price": "1000.00",
+                    "priceModifier": 0.95,
+                    "paymentMethod": "CHEQUE",
+                    "additionalItem": {"bank": "Bangkok Bank", "chequeNumber": "CH123456789"},
+                },
+                {"finalPrice": "950.00", "points": 0},
+                id="cheque",
+            ),
+        ],
+    )
+    # Uses the test database: kept on one xdist worker (see README)
+    @pytest.mark.integration
+    @pytest.mark.xdist_group("db")
+    async def test_create_payment(self, test_client, payment, expected):
+        """Test creating a payment with each kind of payment method."""
+        data = await execute(
+            test_client, CREATE_PAYMENT_MUTATION, {"input": payment_input(payment)}
+        )
 
         assert "errors" not in data
-        result = data["data"]["createPayment"]
-        assert result["finalPrice"] == "100.00"
-        assert result["points"] == 5  # 100 * 0.05
-
-    async def test_create_payment_cash(self, test_client):
-        """Test creating a payment with CASH."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "customer123"
-                    price: "200.00"
-                    priceModifier: 0.9
-                    paymentMethod: CASH
-                    datetime: "2022-09-01T10:30:00Z"
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["finalPrice"] == "180.00"  # 200 * 0.9
-        assert result["points"] == 10  # 200 * 0.05
-
-    async def test_create_payment_invalid_price_modifier(self, test_client):
-        """Test error when price modifier is out of range."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "100.00"
-                    priceModifier: 0.8
-                    paymentMethod: CASH
-                    datetime: "2022-09-01T00:00:00Z"
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
+        assert data["data"]["createPayment"] == expected
+
+    @pytest.mark.parametrize(
+        "payment,key,expected",
+        [
+            pytest.param({"priceModifier": 0.8}, "field", "priceModifier", id="price-modifier"),
+            pytest.param(
+                {"priceModifier": 0.95, "paymentMethod": "VISA"},
+                "message",
+                "last4",
+                id="card-missing-last4",
+            ),
+            pytest.param(
+                {"paymentMethod": "CASH_ON_DELIVERY", "additionalItem": {"courier": "FEDEX"}},
+                "message",
+                "Invalid courier",
+                id="invalid-courier",
+            ),
+            pytest.param({"price": "not_a_number"}, "field", "price", id="invalid-price"),
+        ],
+    )
+    async def test_create_payment_validation_error(self, app_client, payment, key, expected):
+        """Test invalid payments are rejected with a validation error."""
+        data = await execute(app_client, CREATE_PAYMENT_MUTATION, {"input": payment_input(payment)})
 
         result = data["data"]["createPayment"]
         assert result["error"] == "VALIDATION_ERROR"
-        assert "priceModifier" in result["field"]
-
-    async def test_create_payment_missing_last4_for_card(self, test_client):
-        """Test error when card payment is missing last4."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "100.00"
-                    priceModifier: 0.95
-                    paymentMethod: VISA
-                    datetime: "2022-09-01T00:00:00Z"
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["error"] == "VALIDATION_ERROR"
-        assert "last4" in result["message"]
-
-    async def test_create_payment_invalid_courier(self, test_client):
-        """Test error when CASH_ON_DELIVERY has invalid courier."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "100.00"
-                    priceModifier: 1.0
-                    paymentMethod: CASH_ON_DELIVERY
-                    datetime: "2022-09-01T00:00:00Z"
-                    additionalItem: { courier: "FEDEX" }
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["error"] == "VALIDATION_ERROR"
-        assert "Invalid courier" in result["message"]
-
-    async def test_create_payment_invalid_price_format(self, test_client):
-        """Test error when price is not a valid number."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "not_a_number"
-                    priceModifier: 1.0
-                    paymentMethod: CASH
-                    datetime: "2022-09-01T00:00:00Z"
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["error"] == "VALIDATION_ERROR"
-        assert "price" in result["field"]
-
-    async def test_create_payment_bank_transfer(self, test_client):
-        """Test creating a payment with BANK_TRANSFER."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "500.00"
-                    priceModifier: 1.0
-                    paymentMethod: BANK_TRANSFER
-                    datetime: "2022-09-01T00:00:00Z"
-                    additionalItem: {
-                        bank: "Kasikorn Bank"
-                        accountNumber: "1234567890"
-                    }
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["finalPrice"] == "500.00"
-        assert result["points"] == 0  # BANK_TRANSFER gives no points
-
-    async def test_create_payment_cheque(self, test_client):
-        """Test creating a payment with CHEQUE."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "1000.00"
-                    priceModifier: 0.95
-                    paymentMethod: CHEQUE
-                    datetime: "2022-09-01T00:00:00Z"
-                    additionalItem: {
-                        bank: "Bangkok Bank"
-                        chequeNumber: "CH123456789"
-                    }
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["finalPrice"] == "950.00"
-        assert result["points"] == 0
+        assert expected in result[key]
 
 
+# Uses the test database: kept on one xdist worker (see README)
+@pytest.mark.integration
+@pytest.mark.xdist_group("db")
 class TestSalesReportQuery:
     """Tests for the salesReport GraphQL query."""
 
-    async def test_sales_report_with_data(self, test_client, sample_payments):
-        """Test sales report returns aggregated data."""
-        query = """
-            query {
-                salesReport(input: {
-                    startDatetime: "2022-09-01T00:00:00Z"
-                    endDatetime: "2022-09-01T23:59:59Z"
-                }) {
-                    ... on SalesReportResponse {
-                        sales {
-                            datetime
-                            sales
-                            points
-                        }
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": query})
-        assert response.status_code == 200
-        data = response.json()
+    @pytest.mark.parametrize(
+        "start,end,expected",
+        [
+            pytest.param(
+                "2022-09-01T00:00:00Z",
+                "2022-09-01T23:59:59Z",
+                {"sales": SAMPLE_HOURLY_SALES},
+                id="with-data",
+            ),
+            pytest.param(
+                "2020-01-01T00:00:00Z", "2020-01-01T23:59:59Z", {"sales": []}, id="empty-range"
+            ),
+            pytest.param(
+                "2022-09-02T00:00:00Z",
+                "2022-09-01T00:00:00Z",
+                {"error": "VALIDATION_ERROR"},
+                id="end-before-start",
+            ),
+        ],
+    )
+    async def test_sales_report(self, test_client, sample_payments, start, end, expected):
+        """Test hourly aggregation, empty ranges and range validation."""
+        data = await execute(test_client, SALES_REPORT_QUERY, sales_report_input(start, end))
 
         result = data["data"]["salesReport"]
-        assert "sales" in result
-        assert len(result["sales"]) > 0
-
-    async def test_sales_report_empty_range(self, test_client):
-        """Test sales report with no data in range."""
-        query = """
-            query {
-                salesReport(input: {
-                    startDatetime: "2020-01-01T00:00:00Z"
-                    endDatetime: "2020-01-01T23:59:59Z"
-                }) {
-                    ... on SalesReportResponse {
-                        sales {
-                            datetime
-                            sales
-                            points
-                        }
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": query})
-        assert response.status_code == 200
-        data = response.json()
+        assert {key: result[key] for key in expected} == expected
+
+    async def test_sales_report_batched(self, test_client, sample_payments):
+        """Test several reports can be fetched in one request through field aliases."""
+        data = await execute(
+            test_client,
+            SALES_REPORT_BATCH_QUERY,
+            {
+                "withData": {
+                    "startDatetime": "2022-09-01T00:00:00Z",
+                    "endDatetime": "2022-09-01T23:59:59Z",
+                },
+                "empty": {
+                    "startDatetime": "2020-01-01T00:00:00Z",
+                    "endDatetime": "2020-01-01T23:59:59Z",
+                },
+                "invalid": {
+                    "startDatetime": "2022-09-02T00:00:00Z",
+                    "endDatetime": "2022-09-01T00:00:00Z",
+                },
+            },
+        )
+
+        reports = data["data"]
+        assert reports["withData"]["sales"] == SAMPLE_HOURLY_SALES
+        assert reports["empty"]["sales"] == []
+        assert reports["invalid"]["error"] == "VALIDATION_ERROR"
+
+    async def test_sales_report_includes_created_payment(self, test_client):
+        """Test a payment created via the mutation is committed and reported."""
+        payment = {
+            "priceModifier": 0.95,
+            "paymentMethod": "VISA",
+            "datetime": "2022-09-01T05:10:00Z",
+            "additionalItem": {"last4": "1234"},
+        }
+        data = await execute(
+            test_client, CREATE_PAYMENT_MUTATION, {"input": payment_input(payment)}
+        )
+        assert data["data"]["createPayment"]["finalPrice"] == "95.00"
+
+        data = await execute(
+            test_client,
+            SALES_REPORT_QUERY,
+            sales_report_input("2022-09-01T05:00:00Z", "2022-09-01T05:59:59Z"),
+        )
 
         result = data["data"]["salesReport"]
-        assert result["sales"] == []
-
-    async def test_sales_report_invalid_range(self, test_client):
-        """Test error when end datetime is before start."""
-        query = """
-            query {
-                salesReport(input: {
-                    startDatetime: "2022-09-02T00:00:00Z"
-                    endDatetime: "2022-09-01T00:00:00Z"
-                }) {
-                    ... on SalesReportResponse {
-                        sales {
-                            datetime
-                            sales
-                            points
-                        }
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": query})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["salesReport"]
-        assert result["error"] == "VALIDATION_ERROR"
+        assert result["sales"] == [
+            {"datetime": "2022-09-01T05:00:00Z", "sales": "95.00", "points": 3}
+        ]
 
 
 class TestSupportedPaymentMethodsQuery:
     """Tests for the supportedPaymentMethods query."""
 
-    async def test_get_supported_methods(self, test_client):
+    async def test_get_supported_methods(self, app_client):
         """Test listing all supported payment methods."""
-        query = """
-            query {
-                supportedPaymentMethods
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": query})
-        assert response.status_code == 200
-        data = response.json()
+        data = await execute(app_client, SUPPORTED_METHODS_QUERY)
 
         methods = data["data"]["supportedPaymentMethods"]
         assert "CASH" in methods
@@ -425,207 +266,22 @@ class TestSupportedPaymentMethodsQuery:
         assert "CASH_ON_DELIVERY" in methods
         assert len(methods) == 12  # All 12 payment methods
 
+    async def test_no_session_opened_without_database_access(self, app_client):
+        """Test queries that don't touch the database never open a session."""
+        with patch("app.main.AsyncSessionLocal") as session_factory:
+            await execute(app_client, SUPPORTED_METHODS_QUERY)
+
+        session_factory.assert_not_called()
+
 
 class TestRootEndpoint:
     """Tests for the root endpoint."""
 
-    async def test_root_endpoint(self, test_client):
+    async def test_root_endpoint(self, asgi_client):
         """Test root endpoint returns API information."""
-        response = await test_client.get("/")
+        response = await asgi_client.get("/")
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         assert "message" in data
         assert "graphql_endpoint" in data
         assert data["graphql_endpoint"] == "/graphql"
-
-
-class TestPaymentValidation:
-    """Tests for payment validation edge cases."""
-
-    async def test_create_payment_empty_customer_id(self, test_client):
-        """Test error when customer ID is empty."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "   "
-                    price: "100.00"
-                    priceModifier: 1.0
-                    paymentMethod: CASH
-                    datetime: "2022-09-01T00:00:00Z"
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["error"] == "VALIDATION_ERROR"
-        assert "customerId" in result["field"]
-
-    async def test_create_payment_zero_price(self, test_client):
-        """Test error when price is zero."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "0"
-                    priceModifier: 1.0
-                    paymentMethod: CASH
-                    datetime: "2022-09-01T00:00:00Z"
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["error"] == "VALIDATION_ERROR"
-        assert "price" in result["field"]
-
-    async def test_create_payment_negative_price(self, test_client):
-        """Test error when price is negative."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "-50.00"
-                    priceModifier: 1.0
-                    paymentMethod: CASH
-                    datetime: "2022-09-01T00:00:00Z"
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["error"] == "VALIDATION_ERROR"
-        assert "price" in result["field"]
-
-    async def test_create_payment_bank_transfer_missing_all(self, test_client):
-        """Test error when bank transfer has no additional item."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "100.00"
-                    priceModifier: 1.0
-                    paymentMethod: BANK_TRANSFER
-                    datetime: "2022-09-01T00:00:00Z"
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["error"] == "VALIDATION_ERROR"
-        assert "bank" in result["message"] or "additionalItem" in result["field"]
-
-    async def test_create_payment_cheque_missing_all(self, test_client):
-        """Test error when cheque has no additional item."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "100.00"
-                    priceModifier: 1.0
-                    paymentMethod: CHEQUE
-                    datetime: "2022-09-01T00:00:00Z"
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["error"] == "VALIDATION_ERROR"
-
-    async def test_create_payment_cheque_missing_bank(self, test_client):
-        """Test error when cheque is missing bank name."""
-        mutation = """
-            mutation {
-                createPayment(input: {
-                    customerId: "12345"
-                    price: "100.00"
-                    priceModifier: 1.0
-                    paymentMethod: CHEQUE
-                    datetime: "2022-09-01T00:00:00Z"
-                    additionalItem: {
-                        chequeNumber: "CH123456"
-                    }
-                }) {
-                    ... on PaymentResponse {
-                        finalPrice
-                        points
-                    }
-                    ... on ErrorResponse {
-                        error
-                        message
-                        field
-                    }
-                }
-            }
-        """
-        response = await test_client.post("/graphql", json={"query": mutation})
-        assert response.status_code == 200
-        data = response.json()
-
-        result = data["data"]["createPayment"]
-        assert result["error"] == "VALIDATION_ERROR"
-        assert "bank" in result["message"]
@@ -0,0 +1,24 @@
+"""
+Unit Tests for the Payment Model
+
+Tests that the Payment repr shows the bare payment method value.
+"""
+
+from decimal import Decimal
+
+from app.models.payment import Payment, PaymentMethod
+
+
+class TestPaymentModel:
+    """Tests for the Payment model."""
+
+    def test_repr(self):
+        """Test the repr shows the payment method value, not the enum member."""
+        payment = Payment(
+            id=1,
+            customer_id="customer1",
+            payment_method=PaymentMethod.CASH,
+            final_price=Decimal("95.00"),
+        )
+
+        assert repr(payment) == "<Payment(id=1, customer=customer1, method=CASH, final=95.00)>"
@@ -0,0 +1,62 @@
+"""
+Tests for Payment Partitions
+
+Tests the monthly partitioning of the payments table:
+- Month arithmetic and partition naming
+- Rows routed to their month's partition, or the default partition
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.models.partitions import add_months, create_month_partition, partition_name
+
+
+class TestPartitionNaming:
+    """Tests for partition month helpers."""
+
+    @pytest.mark.parametrize(
+        "month,months,expected",
+        [
+            (date(2022, 9, 1), 1, date(2022, 10, 1)),
+            (date(2022, 12, 1), 1, date(2023, 1, 1)),
+            (date(2023, 1, 1), -1, date(2022, 12, 1)),
+            (date(2022, 9, 1), 15, date(2023, 12, 1)),
+        ],
+    )
+    def test_add_months(self, month, months, expected):
+        """Test month arithmetic across year boundaries."""
+        assert add_months(month, months) == expected
+
+    def test_partition_name(self):
+        """Test partitions are named after their year and month."""
+        assert partition_name(date(2022, 9, 15)) == "payments_2022_09"
+
+
+# Uses the test database: kept on one xdist worker (see README)
+@pytest.mark.integration
+@pytest.mark.xdist_group("db")
+class TestPartitionRouting:
+    """Tests for rows landing in the right partition."""
+
+    async def test_rows_routed_by_month(self, db_connection):
+        """Test payments go to their month's partition, others to the default."""
+        await create_month_partition(db_connection, date(2022, 9, 1))
+        # Idempotent: creating an existing partition is a no-op
+        await create_month_partition(db_connection, date(2022, 9, 20))
+
+        await db_connection.execute(
+            text(
+                "INSERT INTO payments (customer_id, price, price_modifier, final_price, "
+                "points, payment_method, datetime) VALUES "
+                "('c1', 100, 1, 100, 5, 'CASH', '2022-09-30T23:59:59Z'), "
+                "('c2', 100, 1, 100, 5, 'CASH', '2022-10-01T00:00:00Z')"
+            )
+        )
+        result = await db_connection.execute(
+            text("SELECT customer_id, tableoid::regclass::text FROM payments ORDER BY 1")
+        )
+
+        assert result.all() == [("c1", "payments_2022_09"), ("c2", "payments_default")]
@@ -17,71 +17,64 @@ import pytest
 from app.models.payment import PaymentMethod
 from app.payment_methods.base import PaymentMethodError
 from app.payment_methods.factory import get_payment_method
-from app.payment_methods.methods import (
-    AmexPayment,
-    BankTransferPayment,
-    CashOnDeliveryPayment,
-    CashPayment,
-    ChequePayment,
-    GrabPayPayment,
-    JcbPayment,
-    LinePayPayment,
-    MastercardPayment,
-    PayPayPayment,
-    PointsPayment,
-    VisaPayment,
-)
+from app.payment_methods.methods import LinePayPayment, VisaPayment
+
+# Shared inputs, parsed once instead of in every test
+PRICE = Decimal("100.00")
+NO_MODIFIER = Decimal("1.0")
+FIVE_PERCENT_OFF = Decimal("0.95")
 
 
 class TestCashPayment:
     """Tests for CASH payment method."""
 
-    def test_valid_price_modifier_minimum(self):
-        """Test minimum allowed price modifier (0.9)."""
-        handler = CashPayment()
-        final_price, points, additional = handler.process(
-            price=Decimal("100.00"), price_modifier=Decimal("0.9"), additional_item=None
+    @pytest.mark.parametrize(
+        "price,modifier,expected_final,expected_points",
+        [
+            pytest.param(PRICE, Decimal("0.9"), Decimal("90.00"), 5, id="minimum-modifier"),
+            pytest.param(PRICE, NO_MODIFIER, PRICE, 5, id="maximum-modifier"),
+            # Points come from the original price: 200 * 0.05 = 10, not 180 * 0.05
+            pytest.param(
+                Decimal("200.00"),
+                Decimal("0.9"),
+                Decimal("180.00"),
+                10,
+                id="points-from-original-price",
+            ),
+        ],
+    )
+    def test_valid_price_modifier(self, price, modifier, expected_final, expected_points):
+        """Test final price and points within the allowed modifier range."""
+        handler = get_payment_method(PaymentMethod.CASH)
+        final_price, points, _ = handler.process(
+            price=price, price_modifier=modifier, additional_item=None
         )
-        assert final_price == Decimal("90.00")
-        assert points == 5  # 100 * 0.05 = 5
+        assert final_price == expected_final
+        assert points == expected_points
 
-    def test_valid_price_modifier_maximum(self):
-        """Test maximum allowed price modifier (1.0)."""
-        handler = CashPayment()
-        final_price, points, additional = handler.process(
-            price=Decimal("100.00"), price_modifier=Decimal("1.0"), additional_item=None
-        )
-        assert final_price == Decimal("100.00")
-        assert points == 5
-
-    def test_invalid_price_modifier_too_low(self):
-        """Test price modifier below minimum."""
-        handler = CashPayment()
-        with pytest.raises(PaymentMethodError) as exc_info:
-            handler.process(
-                price=Decimal("100.00"), price_modifier=Decimal("0.89"), additional_item=None
-            )
-        assert "priceModifier" in exc_info.value.field
-
-    def test_invalid_price_modifier_too_high(self):
-        """Test price modifier above maximum."""
-        handler = CashPayment()
+    @pytest.mark.parametrize(
+        "modifier",
+        [
+            pytest.param(Decimal("0.89"), id="too-low"),
+            pytest.param(Decimal("1.01"), id="too-high"),
+        ],
+    )
+    def test_invalid_price_modifier(self, modifier):
+        """Test price modifier outside the allowed range."""
+        handler = get_payment_method(PaymentMethod.CASH)
         with pytest.raises(PaymentMethodError) as exc_info:
-            handler.process(
-                price=Decimal("100.00"), price_modifier=Decimal("1.01"), additional_item=None
-            )
+            handler.process(price=PRICE, price_modifier=modifier, additional_item=None)
         assert "priceModifier" in exc_info.value.field
 
-    def test_points_calculation(self):
-        """Test points are calculated from original price."""
-        handler = CashPayment()
-        final_price, points, _ = handler.process(
-            price=Decimal("200.00"), price_modifier=Decimal("0.9"), additional_item=None
-        )
-        # Points from original price: 200 * 0.05 = 10
-        assert points == 10
-        # Final price with discount: 200 * 0.9 = 180
-        assert final_price == Decimal("180.00")
+    def test_final_price_rounds_half_to_even(self):
+        """Test final price rounding and points truncation on odd amounts."""
+        handler = get_payment_method(PaymentMethod.CASH)
+        # 10.05 * 0.95 = 9.5475 -> 9.55; 10.10 * 0.95 = 9.595 -> 9.60 (half to even)
+        assert handler.calculate_final_price(Decimal("10.05"), FIVE_PERCENT_OFF) == Decimal("9.55")
+        assert handler.calculate_final_price(Decimal("10.10"), FIVE_PERCENT_OFF) == Decimal("9.60")
+        assert handler.calculate_final_price(Decimal("10.30"), FIVE_PERCENT_OFF) == Decimal("9.78")
+        # 39.99 * 0.05 = 1.9995 -> 1 point
+        assert handler.calculate_points(Decimal("39.99"), handler._points_rate_bp) == 1
 
 
 class TestCashOnDeliveryPayment:
@@ -89,21 +82,21 @@ class TestCashOnDeliveryPayment:
 
     def test_valid_courier_yamato(self):
         """Test valid YAMATO courier."""
-        handler = CashOnDeliveryPayment()
+        handler = get_payment_method(PaymentMethod.CASH_ON_DELIVERY)
         final_price, points, additional = handler.process(
-            price=Decimal("100.00"),
-            price_modifier=Decimal("1.0"),
+            price=PRICE,
+            price_modifier=NO_MODIFIER,
             additional_item={"courier": "YAMATO"},
         )
-        assert final_price == Decimal("100.00")
+        assert final_price == PRICE
         assert points == 5
         assert additional["courier"] == "YAMATO"
 
     def test_valid_courier_sagawa(self):
         """Test valid SAGAWA courier."""
-        handler = CashOnDeliveryPayment()
+        handler = get_payment_method(PaymentMethod.CASH_ON_DELIVERY)
         _, _, additional = handler.process(
-            price=Decimal("100.00"),
+            price=PRICE,
             price_modifier=Decimal("1.02"),
             additional_item={"courier": "SAGAWA"},
         )
@@ -111,39 +104,37 @@ class TestCashOnDeliveryPayment:
 
     def test_courier_case_insensitive(self):
         """Test courier name is normalized to uppercase."""
-        handler = CashOnDeliveryPayment()
+        handler = get_payment_method(PaymentMethod.CASH_ON_DELIVERY)
         _, _, additional = handler.process(
-            price=Decimal("100.00"),
-            price_modifier=Decimal("1.0"),
+            price=PRICE,
+            price_modifier=NO_MODIFIER,
             additional_item={"courier": "yamato"},
         )
         assert additional["courier"] == "YAMATO"
 
     def test_missing_courier(self):
         """Test error when courier is missing."""
-        handler = CashOnDeliveryPayment()
+        handler = get_payment_method(PaymentMethod.CASH_ON_DELIVERY)
         with pytest.raises(PaymentMethodError) as exc_info:
-            handler.process(
-                price=Decimal("100.00"), price_modifier=Decimal("1.0"), additional_item={}
-            )
+            handler.process(price=PRICE, price_modifier=NO_MODIFIER, additional_item={})
         assert "courier" in exc_info.value.message
 
     def test_invalid_courier(self):
         """Test error with invalid courier name."""
-        handler = CashOnDeliveryPayment()
+        handler = get_payment_method(PaymentMethod.CASH_ON_DELIVERY)
         with pytest.raises(PaymentMethodError) as exc_info:
             handler.process(
-                price=Decimal("100.00"),
-                price_modifier=Decimal("1.0"),
+                price=PRICE,
+                price_modifier=NO_MODIFIER,
                 additional_item={"courier": "FEDEX"},
             )
         assert "Invalid courier" in exc_info.value.message
 
     def test_price_modifier_with_surcharge(self):
         """Test maximum 2% surcharge."""
-        handler = CashOnDeliveryPayment()
+        handler = get_payment_method(PaymentMethod.CASH_ON_DELIVERY)
         final_price, _, _ = handler.process(
-            price=Decimal("100.00"),
+            price=PRICE,
             price_modifier=Decimal("1.02"),
             additional_item={"courier": "YAMATO"},
         )
@@ -154,63 +145,56 @@ class TestCardPayments:
     """Tests for card payment methods (VISA, MASTERCARD, AMEX, JCB)."""
 
     @pytest.mark.parametrize(
-        "handler_class,min_mod,max_mod,points_rate",
+        "payment_method,min_mod,max_mod,points_rate",
         [
-            (VisaPayment, "0.95", "1.0", 3),
-            (MastercardPayment, "0.95", "1.0", 3),
-            (AmexPayment, "0.98", "1.01", 2),
-            (JcbPayment, "0.95", "1.0", 5),
+            (PaymentMethod.VISA, FIVE_PERCENT_OFF, NO_MODIFIER, 3),
+            (PaymentMethod.MASTERCARD, FIVE_PERCENT_OFF, NO_MODIFIER, 3),
+            (PaymentMethod.AMEX, Decimal("0.98"), Decimal("1.01"), 2),
+            (PaymentMethod.JCB, FIVE_PERCENT_OFF, NO_MODIFIER, 5),
         ],
     )
-    def test_valid_card_payment(self, handler_class, min_mod, max_mod, points_rate):
+    def test_valid_card_payment(self, payment_method, min_mod, max_mod, points_rate):
         """Test valid card payment with last4 digits."""
-        handler = handler_class()
+        handler = get_payment_method(payment_method)
         final_price, points, additional = handler.process(
-            price=Decimal("100.00"),
-            price_modifier=Decimal(min_mod),
+            price=PRICE,
+            price_modifier=min_mod,
             additional_item={"last4": "1234"},
         )
-        expected_price = Decimal("100.00") * Decimal(min_mod)
+        expected_price = PRICE * min_mod
         assert final_price == expected_price.quantize(Decimal("0.01"))
         assert points == points_rate  # 100 * rate
         assert additional["last4"] == "1234"
 
-    def test_missing_last4(self):
-        """Test error when last4 is missing."""
-        handler = VisaPayment()
-        with pytest.raises(PaymentMethodError) as exc_info:
-            handler.process(
-                price=Decimal("100.00"), price_modifier=Decimal("0.95"), additional_item={}
-            )
-        assert "last4" in exc_info.value.message
-
-    def test_invalid_last4_not_digits(self):
-        """Test error when last4 contains non-digits."""
-        handler = VisaPayment()
-        with pytest.raises(PaymentMethodError) as exc_info:
-            handler.process(
-                price=Decimal("100.00"),
-                price_modifier=Decimal("0.95"),
-                additional_item={"last4": "12ab"},
-            )
-        assert "Invalid card last4" in exc_info.value.message
-
-    def test_invalid_last4_wrong_length(self):
-        """Test error when last4 is not exactly 4 digits."""
-        handler = VisaPayment()
+    @pytest.mark.parametrize(
+        "additional_item,error_substring",
+        [
+            pytest.param({}, "last4", id="missing"),
+            pytest.param({"last4": "12ab"}, "Invalid card last4", id="not-digits"),
+            pytest.param({"last4": "123"}, "exactly 4 digits", id="wrong-length"),
+            pytest.param({"last4": "1234\n"}, "Invalid card last4", id="trailing-newline"),
+            pytest.param(
+                {"last4": "\u0661\u0662\u0663\u0664"}, "Invalid card last4", id="arabic-indic"
+            ),
+            pytest.param({"last4": "\u00b9234"}, "Invalid card last4", id="superscript"),
+        ],
+    )
+    def test_invalid_last4(self, additional_item, error_substring):
+        """Test last4 must be present and exactly 4 ASCII digits."""
+        handler = get_payment_method(PaymentMethod.VISA)
         with pytest.raises(PaymentMethodError) as exc_info:
             handler.process(
-                price=Decimal("100.00"),
-                price_modifier=Decimal("0.95"),
-                additional_item={"last4": "123"},
+                price=PRICE,
+                price_modifier=FIVE_PERCENT_OFF,
+                additional_item=additional_item,
             )
-        assert "exactly 4 digits" in exc_info.value.message
+        assert error_substring in exc_info.value.message
 
     def test_amex_allows_surcharge(self):
         """Test AMEX allows up to 1% surcharge."""
-        handler = AmexPayment()
+        handler = get_payment_method(PaymentMethod.AMEX)
         final_price, _, _ = handler.process(
-            price=Decimal("100.00"),
+            price=PRICE,
             price_modifier=Decimal("1.01"),
             additional_item={"last4": "1234"},
         )
@@ -221,30 +205,52 @@ class TestDigitalPayments:
     """Tests for digital payment methods (LINE_PAY, PAYPAY, GRAB_PAY, POINTS)."""
 
     @pytest.mark.parametrize(
-        "handler_class,points_rate",
+        "payment_method,points_rate",
         [
-            (LinePayPayment, 1),
-            (PayPayPayment, 1),
-            (GrabPayPayment, 1),
-            (PointsPayment, 0),
+            (PaymentMethod.LINE_PAY, 1),
+            (PaymentMethod.PAYPAY, 1),
+            (PaymentMethod.GRAB_PAY, 1),
+            (PaymentMethod.POINTS, 0),
         ],
     )
-    def test_no_price_modification(self, handler_class, points_rate):
+    def test_no_price_modification(self, payment_method, points_rate):
         """Test digital payments don't allow price modification."""
-        handler = handler_class()
+        handler = get_payment_method(payment_method)
         final_price, points, _ = handler.process(
-            price=Decimal("100.00"), price_modifier=Decimal("1.0"), additional_item=None
+            price=PRICE, price_modifier=NO_MODIFIER, additional_item=None
         )
-        assert final_price == Decimal("100.00")
+        assert final_price == PRICE
         assert points == points_rate
 
-    def test_digital_payment_modifier_must_be_one(self):
+    @pytest.mark.parametrize(
+        "payment_method,modifier",
+        [
+            pytest.param(PaymentMethod.LINE_PAY, Decimal("0.99"), id="line-pay-discount"),
+            pytest.param(PaymentMethod.PAYPAY, Decimal("1.01"), id="paypay-surcharge"),
+            pytest.param(PaymentMethod.GRAB_PAY, Decimal("0.99"), id="grab-pay-discount"),
+            pytest.param(PaymentMethod.POINTS, Decimal("1.01"), id="points-surcharge"),
+        ],
+    )
+    def test_digital_payment_modifier_must_be_one(self, payment_method, modifier):
         """Test digital payments reject modifier != 1.0."""
-        handler = LinePayPayment()
-        with pytest.raises(PaymentMethodError):
-            handler.process(
-                price=Decimal("100.00"), price_modifier=Decimal("0.99"), additional_item=None
-            )
+        handler = get_payment_method(payment_method)
+        with pytest.raises(PaymentMethodError) as exc_info:
+            handler.process(price=PRICE, price_modifier=modifier, additional_item=None)
+        assert "priceModifier" in exc_info.value.field
+
+    def test_custom_validator_is_still_called(self):
+        """Test the no-data fast path doesn't bypass an overridden validator."""
+
+        class TaggedLinePay(LinePayPayment):
+            __slots__ = ()
+
+            def validate_additional_item(self, additional_item: dict | None) -> dict:
+                return {"tagged": True}
+
+        _, _, additional = TaggedLinePay().process(
+            price=PRICE, price_modifier=NO_MODIFIER, additional_item=None
+        )
+        assert additional == {"tagged": True}
 
 
 class TestBankTransferPayment:
@@ -252,49 +258,45 @@ class TestBankTransferPayment:
 
     def test_valid_bank_transfer(self):
         """Test valid bank transfer with all required fields."""
-        handler = BankTransferPayment()
+        handler = get_payment_method(PaymentMethod.BANK_TRANSFER)
         final_price, points, additional = handler.process(
-            price=Decimal("100.00"),
-            price_modifier=Decimal("1.0"),
+            price=PRICE,
+            price_modifier=NO_MODIFIER,
             additional_item={"bank": "Kasikorn", "account_number": "1234567890"},
         )
-        assert final_price == Decimal("100.00")
+        assert final_price == PRICE
         assert points == 0
         assert additional["bank"] == "Kasikorn"
         assert additional["account_number"] == "1234567890"
 
-    def test_missing_additional_item(self):
-        """Test error when additional_item is None."""
-        handler = BankTransferPayment()
-        with pytest.raises(PaymentMethodError) as exc_info:
-            handler.process(
-                price=Decimal("100.00"),
-                price_modifier=Decimal("1.0"),
-                additional_item=None,
-            )
-        assert "bank" in exc_info.value.message or "additionalItem" in exc_info.value.field
-
-    def test_missing_bank(self):
-        """Test error when bank is missing."""
-        handler = BankTransferPayment()
-        with pytest.raises(PaymentMethodError) as exc_info:
-            handler.process(
-                price=Decimal("100.00"),
-                price_modifier=Decimal("1.0"),
-                additional_item={"account_number": "1234567890"},
-            )
-        assert "bank" in exc_info.value.message
+    def test_strips_values_and_drops_unknown_keys(self):
+        """Test required values are stripped and undeclared keys are not stored."""
+        handler = get_payment_method(PaymentMethod.BANK_TRANSFER)
+        _, _, additional = handler.process(
+            price=PRICE,
+            price_modifier=NO_MODIFIER,
+            additional_item={"bank": " Kasikorn ", "account_number": 1234567890, "memo": "x"},
+        )
+        assert additional == {"bank": "Kasikorn", "account_number": "1234567890"}
 
-    def test_missing_account_number(self):
-        """Test error when account_number is missing."""
-        handler = BankTransferPayment()
+    @pytest.mark.parametrize(
+        "additional_item,error_substring",
+        [
+            pytest.param(None, "bank", id="missing-additional-item"),
+            pytest.param({"account_number": "1234567890"}, "bank", id="missing-bank"),
+            pytest.param({"bank": "Kasikorn"}, "account_number", id="missing-account-number"),
+        ],
+    )
+    def test_missing_required_field(self, additional_item, error_substring):
+        """Test error when additionalItem or one of its fields is missing."""
+        handler = get_payment_method(PaymentMethod.BANK_TRANSFER)
         with pytest.raises(PaymentMethodError) as exc_info:
             handler.process(
-                price=Decimal("100.00"),
-                price_modifier=Decimal("1.0"),
-                additional_item={"bank": "Kasikorn"},
+                price=PRICE,
+                price_modifier=NO_MODIFIER,
+                additional_item=additional_item,
             )
-        assert "account_number" in exc_info.value.message
+        assert error_substring in exc_info.value.message
 
 
 class TestChequePayment:
@@ -302,9 +304,9 @@ class TestChequePayment:
 
     def test_valid_cheque(self):
         """Test valid cheque payment with all required fields."""
-        handler = ChequePayment()
+        handler = get_payment_method(PaymentMethod.CHEQUE)
         final_price, points, additional = handler.process(
-            price=Decimal("100.00"),
+            price=PRICE,
             price_modifier=Decimal("0.9"),
             additional_item={"bank": "Bangkok Bank", "cheque_number": "CH123456"},
         )
@@ -313,52 +315,39 @@ class TestChequePayment:
         assert additional["bank"] == "Bangkok Bank"
         assert additional["cheque_number"] == "CH123456"
 
-    def test_missing_additional_item(self):
-        """Test error when additional_item is None."""
-        handler = ChequePayment()
-        with pytest.raises(PaymentMethodError) as exc_info:
-            handler.process(
-                price=Decimal("100.00"),
-                price_modifier=Decimal("1.0"),
-                additional_item=None,
-            )
-        assert (
-            "cheque" in exc_info.value.message.lower() or "additionalItem" in exc_info.value.field
-        )
-
-    def test_missing_bank(self):
-        """Test error when bank is missing."""
-        handler = ChequePayment()
-        with pytest.raises(PaymentMethodError) as exc_info:
-            handler.process(
-                price=Decimal("100.00"),
-                price_modifier=Decimal("1.0"),
-                additional_item={"cheque_number": "CH123456"},
-            )
-        assert "bank" in exc_info.value.message
-
-    def test_missing_cheque_number(self):
-        """Test error when cheque_number is missing."""
-        handler = ChequePayment()
+    @pytest.mark.parametrize(
+        "additional_item,error_substring",
+        [
+            pytest.param(None, "cheque", id="missing-additional-item"),
+            pytest.param({"cheque_number": "CH123456"}, "bank", id="missing-bank"),
+            pytest.param({"bank": "Bangkok Bank"}, "cheque_number", id="missing-cheque-number"),
+        ],
+    )
+    def test_missing_required_field(self, additional_item, error_substring):
+        """Test error when additionalItem or one of its fields is missing."""
+        handler = get_payment_method(PaymentMethod.CHEQUE)
         with pytest.raises(PaymentMethodError) as exc_info:
             handler.process(
-                price=Decimal("100.00"),
-                price_modifier=Decimal("1.0"),
-                additional_item={"bank": "Bangkok Bank"},
+                price=PRICE,
+                price_modifier=NO_MODIFIER,
+                additional_item=additional_item,
             )
-        assert "cheque_number" in exc_info.value.message
+        assert error_substring in exc_info.value.message.lower()
 
 
 class TestPaymentMethodFactory:
     """Tests for the payment method factory."""
 
-    @pytest.mark.parametrize("payment_method", list(PaymentMethod))
-    def test_factory_creates_all_methods(self, payment_method):
+    def test_factory_creates_all_methods(self):
         """Test factory can create handler for each payment method."""
-        handler = get_payment_method(payment_method)
-        assert handler is not None
+        for payment_method in PaymentMethod:
+            assert get_payment_method(payment_method) is not None, payment_method
 
     def test_factory_returns_correct_type(self):
         """Test factory returns correct handler type."""
         handler = get_payment_method(PaymentMethod.VISA)
         assert isinstance(handler, VisaPayment)
+
+    def test_factory_reuses_handler_instances(self):
+        """Test factory returns the same stateless handler on every call."""
+        assert get_payment_method(PaymentMethod.VISA) is get_payment_method(PaymentMethod.VISA)
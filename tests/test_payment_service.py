@@ -0,0 +1,108 @@
+"""
+Tests for the Payment Service
+
+Tests that:
+- Decimal parsing only memoizes short strings
+- Batched payment processing writes all rows with a single INSERT statement
+- Batched payment processing writes nothing when any item is invalid
+"""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app.models.payment import Payment, PaymentMethod
+from app.services.payment_service import (
+    PaymentService,
+    PaymentServiceError,
+    _cached_decimal,
+    _to_decimal,
+)
+
+
+class TestToDecimal:
+    """Tests for the memoized decimal parser."""
+
+    def test_only_short_strings_are_cached(self):
+        """Test long inputs are parsed without being kept in the cache."""
+        _cached_decimal.cache_clear()
+
+        assert _to_decimal("100.00") == Decimal("100.00")
+        assert _to_decimal("1" * 100) == Decimal("1" * 100)
+
+        assert _cached_decimal.cache_info().currsize == 1
+
+
+# Uses the test database: kept on one xdist worker (see README)
+@pytest.mark.integration
+@pytest.mark.xdist_group("db")
+class TestProcessPayments:
+    """Tests for PaymentService.process_payments."""
+
+    async def test_batch_inserts_in_one_statement(self, db_connection, test_session):
+        """Test a batch is priced per item and inserted with one statement."""
+        statements = []
+        event.listen(
+            db_connection.sync_connection,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        service = PaymentService(test_session)
+
+        results = await service.process_payments(
+            [
+                {
+                    "customer_id": "customer1",
+                    "price": "100.00",
+                    "price_modifier": 0.95,
+                    "payment_method": PaymentMethod.VISA,
+                    "transaction_datetime": datetime(2022, 9, 1, 0, 30, tzinfo=UTC),
+                    "additional_item": {"last4": "1234"},
+                },
+                {
+                    "customer_id": "customer2",
+                    "price": "200.00",
+                    "price_modifier": 1.0,
+                    "payment_method": "CASH",
+                    "transaction_datetime": datetime(2022, 9, 1, 1, 0, tzinfo=UTC),
+                },
+            ]
+        )
+
+        assert results == [
+            {"final_price": "95.00", "points": 3},
+            {"final_price": "200.00", "points": 10},
+        ]
+        assert sum("INSERT" in statement for statement in statements) == 1
+        count = await test_session.scalar(select(func.count()).select_from(Payment))
+        assert count == 2
+
+    async def test_invalid_item_writes_nothing(self, test_session):
+        """Test one invalid item rejects the whole batch before any insert."""
+        service = PaymentService(test_session)
+
+        with pytest.raises(PaymentServiceError) as exc_info:
+            await service.process_payments(
+                [
+                    {
+                        "customer_id": "customer1",
+                        "price": "100.00",
+                        "price_modifier": 1.0,
+                        "payment_method": "CASH",
+                        "transaction_datetime": datetime(2022, 9, 1, tzinfo=UTC),
+                    },
+                    {
+                        "customer_id": "customer2",
+                        "price": "100.00",
+                        "price_modifier": 1.0,
+                        "payment_method": "VISA",
+                        "transaction_datetime": datetime(2022, 9, 1, tzinfo=UTC),
+                    },
+                ]
+            )
+
+        assert exc_info.value.field == "additionalItem.last4"
+        count = await test_session.scalar(select(func.count()).select_from(Payment))
+        assert count == 0
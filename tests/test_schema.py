@@ -0,0 +1,131 @@
+"""
+Schema-Level Tests for GraphQL Operations
+
+Runs operations straight against the Strawberry schema, without HTTP,
+ASGI or JSON encoding, for:
+- Payment input validation errors
+
+Documents repeat across tests, so the schema's ParserCache parses each one
+once. The HTTP round trip is covered by the integration tests in
+test_graphql.py.
+"""
+
+import pytest
+
+from app.graphql.context import GraphQLContext
+from app.main import schema
+from tests.graphql_documents import CREATE_PAYMENT_MUTATION, payment_input
+
+pytestmark = pytest.mark.asyncio
+
+
+async def execute(context: GraphQLContext, query: str, variables: dict | None = None) -> dict:
+    """Execute a GraphQL document on the schema and return its data."""
+    result = await schema.execute(query, variable_values=variables, context_value=context)
+    assert result.errors is None
+    return result.data
+
+
+class TestPaymentValidation:
+    """Tests for payment validation edge cases."""
+
+    async def test_create_payment_empty_customer_id(self, graphql_context):
+        """Test error when customer ID is empty."""
+        data = await execute(
+            graphql_context,
+            CREATE_PAYMENT_MUTATION,
+            {"input": payment_input({"customerId": "   "})},
+        )
+
+        result = data["createPayment"]
+        assert result["error"] == "VALIDATION_ERROR"
+        assert "customerId" in result["field"]
+
+    async def test_create_payment_zero_price(self, graphql_context):
+        """Test error when price is zero."""
+        data = await execute(
+            graphql_context, CREATE_PAYMENT_MUTATION, {"input": payment_input({"price": "0"})}
+        )
+
+        result = data["createPayment"]
+        assert result["error"] == "VALIDATION_ERROR"
+        assert "price" in result["field"]
+
+    async def test_create_payment_negative_price(self, graphql_context):
+        """Test error when price is negative."""
+        data = await execute(
+            graphql_context, CREATE_PAYMENT_MUTATION, {"input": payment_input({"price": "-50.00"})}
+        )
+
+        result = data["createPayment"]
+        assert result["error"] == "VALIDATION_ERROR"
+        assert "price" in result["field"]
+
+    @pytest.mark.parametrize(
+        "price,message",
+        [
+            pytest.param("1E+5000000", "must not exceed", id="huge-exponent"),
+            pytest.param("1E-50000000", "2 decimal places", id="tiny-exponent"),
+            pytest.param("1E-5000000", "2 decimal places", id="small-exponent"),
+            pytest.param("100000000.00", "must not exceed", id="above-column-precision"),
+            pytest.param("100.001", "2 decimal places", id="sub-cent"),
+            pytest.param("NaN", "Invalid price format", id="nan"),
+            pytest.param("Infinity", "Invalid price format", id="infinity"),
+        ],
+    )
+    async def test_create_payment_price_out_of_bounds(self, graphql_context, price, message):
+        """Test prices that don't fit NUMERIC(10, 2) are rejected before any pricing."""
+        data = await execute(
+            graphql_context, CREATE_PAYMENT_MUTATION, {"input": payment_input({"price": price})}
+        )
+
+        result = data["createPayment"]
+        assert result["error"] == "VALIDATION_ERROR"
+        assert result["field"] == "price"
+        assert message in result["message"]
+
+    async def test_create_payment_modifier_tiny_exponent(self, graphql_context):
+        """Test a modifier with an extreme exponent is rejected before the range check."""
+        data = await execute(
+            graphql_context,
+            CREATE_PAYMENT_MUTATION,
+            {"input": payment_input({"priceModifier": 5e-324})},
+        )
+
+        result = data["createPayment"]
+        assert result["error"] == "VALIDATION_ERROR"
+        assert result["field"] == "priceModifier"
+
+    async def test_create_payment_bank_transfer_missing_all(self, graphql_context):
+        """Test error when bank transfer has no additional item."""
+        data = await execute(
+            graphql_context,
+            CREATE_PAYMENT_MUTATION,
+            {"input": payment_input({"paymentMethod": "BANK_TRANSFER"})},
+        )
+
+        result = data["createPayment"]
+        assert result["error"] == "VALIDATION_ERROR"
+        assert "bank" in result["message"] or "additionalItem" in result["field"]
+
+    async def test_create_payment_cheque_missing_all(self, graphql_context):
+        """Test error when cheque has no additional item."""
+        data = await execute(
+            graphql_context,
+            CREATE_PAYMENT_MUTATION,
+            {"input": payment_input({"paymentMethod": "CHEQUE"})},
+        )
+
+        result = data["createPayment"]
+        assert result["error"] == "VALIDATION_ERROR"
+
+    async def test_create_payment_cheque_missing_bank(self, graphql_context):
+        """Test error when cheque is missing bank name."""
+        payment = {"paymentMethod": "CHEQUE", "additionalItem": {"chequeNumber": "CH123456"}}
+        data = await execute(
+            graphql_context, CREATE_PAYMENT_MUTATION, {"input": payment_input(payment)}
+        )
+
+        result = data["createPayment"]
+        assert result["error"] == "VALIDATION_ERROR"
+        assert "bank" in result["message"]